@@ -1,5 +1,6 @@
 """Configuration loader for Meowko."""
 
+import itertools
 import logging
 import os
 from pathlib import Path
@@ -9,6 +10,13 @@ import yaml
 
 logger = logging.getLogger("meowko.config")
 
+# libyaml's C loader/dumper when PyYAML was built with it; same documents, much faster
+YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+YamlDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+# Shared by all Config instances so a re-created singleton never reuses a number
+_generations = itertools.count(1)
+
 
 def _get_local_timezone() -> str:
     """Get local system timezone."""
@@ -60,6 +68,7 @@ DEFAULTS: dict[str, Any] = {
     },
     "voice": {
         "endpointing_ms": 500,
+        "stt_batch_ms": 60,
     },
     "scheduler": {
         "tick_interval": 60,
@@ -90,14 +99,16 @@ class Config:
     _instance: "Config | None" = None
     _data: dict[str, Any]
     _config_path: Path | None
-    _last_modified: float
+    _file_signature: tuple[int, int] | None
+    _generation: int
 
     def __new__(cls) -> "Config":
         if cls._instance is None:
             cls._instance = super().__new__(cls)
             cls._instance._data = {}
             cls._instance._config_path = None
-            cls._instance._last_modified = 0.0
+            cls._instance._file_signature = None
+            cls._instance._generation = 0
         return cls._instance
 
     def load(self, path: Path | None = None) -> None:
@@ -106,23 +117,51 @@ class Config:
             path = Path(__file__).parent.parent / "config.yaml"
 
         self._config_path = path
-        self._last_modified = path.stat().st_mtime
+        st = os.stat(path)
+        self._file_signature = (st.st_mtime_ns, st.st_size)
 
         with open(path, encoding="utf-8") as f:
-            self._data = yaml.safe_load(f)
+            self._data = yaml.load(f, Loader=YamlLoader)
+        self._generation = next(_generations)
         logger.debug(f"Config loaded from {path}")
 
+    def load_from_mapping(self, data: dict[str, Any], path: Path | None = None) -> None:
+        """Load configuration from an already-parsed mapping.
+
+        If *path* is given, it is watched by reload_if_changed() as if the
+        mapping had been read from it.
+        """
+        self._config_path = path
+        if path is not None:
+            st = os.stat(path)
+            self._file_signature = (st.st_mtime_ns, st.st_size)
+        else:
+            self._file_signature = None
+        self._data = data
+        self._generation = next(_generations)
+
+    @property
+    def generation(self) -> int:
+        """Number that changes on every (re)load; key derived caches on it."""
+        return self._generation
+
     def reload_if_changed(self) -> bool:
         """Reload config if file has been modified.
 
+        A single stat() per call; the YAML is only re-parsed when the file's
+        mtime or size differs from the last load.
+
         Returns:
             True if config was reloaded, False otherwise.
         """
-        if self._config_path is None or not self._config_path.exists():
+        if self._config_path is None:
+            return False
+        try:
+            st = os.stat(self._config_path)
+        except OSError:
             return False
 
-        current_mtime = self._config_path.stat().st_mtime
-        if current_mtime > self._last_modified:
+        if (st.st_mtime_ns, st.st_size) != self._file_signature:
             logger.info("Config file changed, reloading...")
             self.load(self._config_path)
             return True
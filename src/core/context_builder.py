@@ -2,13 +2,15 @@
 
 from __future__ import annotations
 
+import hashlib
 import logging
-import uuid
+import os
+import tempfile
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 import yaml
-from src.config import get_config
+from src.config import YamlLoader, get_config
 from src.core.jsonl_store import JSONLStore, _config_now
 from src.core.persona_id import validate_persona_id
 from src.providers.weather import get_weather, weather_code_to_description
@@ -19,6 +21,15 @@ if TYPE_CHECKING:
 logger = logging.getLogger("meowko.core.context")
 
 
+def _file_signature(path: Path) -> tuple[int, int] | None:
+    """Return the file's (mtime_ns, size), or None if it doesn't exist."""
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
 class ContextBuilder:
     """Builds context for LLM from persona and conversation history."""
 
@@ -30,6 +41,16 @@ class ContextBuilder:
         self.store = JSONLStore(data_dir)
         self.config = config
         self._memory_manager: MemoryManager | None = None
+        # persona_id -> ((soul signature, yaml signature), persona)
+        self._persona_cache: dict[
+            str,
+            tuple[
+                tuple[tuple[int, int] | None, tuple[int, int] | None],
+                dict[str, str | None],
+            ],
+        ] = {}
+        # shared prompt path -> ((mtime_ns, size), text)
+        self._prompt_cache: dict[Path, tuple[tuple[int, int], str]] = {}
 
     @property
     def memory_manager(self) -> MemoryManager:
@@ -42,31 +63,42 @@ class ContextBuilder:
     def load_persona(self, persona_id: str) -> dict[str, str | None]:
         """Load persona system prompt, nickname, and voice_id.
 
+        Results are cached and reused until soul.md or persona.yaml changes.
+
         Returns:
             Dict with keys: prompt, nickname, voice_id.
         """
         persona_id = validate_persona_id(persona_id)
         personas_dir = self.data_dir / self.config.paths["personas_dir"]
         persona_dir = personas_dir / persona_id
+        soul_path = persona_dir / "soul.md"
+        persona_yaml_path = persona_dir / "persona.yaml"
+
+        key = (_file_signature(soul_path), _file_signature(persona_yaml_path))
+        cached = self._persona_cache.get(persona_id)
+        if cached is not None and cached[0] == key:
+            return dict(cached[1])
 
         # Load soul.md (system prompt)
-        soul_path = persona_dir / "soul.md"
-        if soul_path.exists():
+        if key[0] is not None:
             system_prompt = soul_path.read_text(encoding="utf-8")
         else:
             system_prompt = f"You are {persona_id}, a helpful assistant."
 
         # Load persona.yaml for nickname and voice_id
-        persona_yaml_path = persona_dir / "persona.yaml"
         nickname = persona_id
         voice_id = None
-        if persona_yaml_path.exists():
+        if key[1] is not None:
             with open(persona_yaml_path, encoding="utf-8") as f:
-                persona_config = yaml.safe_load(f)
+                persona_config = yaml.load(f, Loader=YamlLoader)
             nickname = persona_config.get("nickname", persona_id)
             voice_id = persona_config.get("voice_id")
 
-        return {"prompt": system_prompt, "nickname": nickname, "voice_id": voice_id}
+        persona: dict[str, str | None] = {
+            "prompt": system_prompt, "nickname": nickname, "voice_id": voice_id,
+        }
+        self._persona_cache[persona_id] = (key, persona)
+        return dict(persona)
 
     async def build_context(
         self,
@@ -141,7 +173,7 @@ class ContextBuilder:
             before_count = len(all_events)
             logger.info("Context exceeds threshold, compacting conversation for %s", scope_id)
             await self.memory_manager.compact_conversation(scope_id)
-            after_count = len(self.store.read_all(persona_id, user_id))
+            after_count = sum(1 for _ in self.store.iter_events(persona_id, user_id))
             attempts += 1
 
             if after_count >= before_count:
@@ -173,7 +205,10 @@ class ContextBuilder:
         )
 
     def _load_shared_prompts(self) -> list[str]:
-        """Load shared system prompt files listed in config.prompts."""
+        """Load shared system prompt files listed in config.prompts.
+
+        Each file is re-read only when its mtime or size changes.
+        """
         names = self.config.get("prompts", [])
         if not names:
             return []
@@ -182,10 +217,15 @@ class ContextBuilder:
         results = []
         for name in names:
             path = prompts_dir / name
-            if path.exists():
-                results.append(path.read_text(encoding="utf-8"))
-            else:
+            signature = _file_signature(path)
+            if signature is None:
                 logger.warning("Shared prompt not found: %s", path)
+                continue
+            cached = self._prompt_cache.get(path)
+            if cached is None or cached[0] != signature:
+                cached = (signature, path.read_text(encoding="utf-8"))
+                self._prompt_cache[path] = cached
+            results.append(cached[1])
         return results
 
     async def _build_context_info(self) -> str:
@@ -222,24 +262,33 @@ class ContextBuilder:
     ) -> str:
         """Save bytes to the cache directory and return the relative path.
 
-        Path format: cache/{persona_id}-{user_id}/{date}/{HH-MM-SS}-{uuid}.{ext}
+        Path format: cache/{persona_id}-{user_id}/{blake2b digest}.{ext}. Identical
+        bytes map to the same file, so resent attachments are stored once.
 
         Returns:
-            Path relative to data_dir (e.g. "cache/meowko-123/2026-02-07/14-30-52-a1b2c3d4.jpg").
+            Path relative to data_dir (e.g. "cache/meowko-123/3f2a...c9.jpg").
         """
         persona_id = validate_persona_id(persona_id)
         cache_dir = self.config.paths["cache_dir"]
         scope = f"{persona_id}-{user_id}"
-        now = _config_now()
-        date_str = now.strftime("%Y-%m-%d")
-        time_str = now.strftime("%H-%M-%S")
-        short_id = uuid.uuid4().hex[:8]
-        ext = Path(filename).suffix
-        rel = Path(cache_dir) / scope / date_str / f"{time_str}-{short_id}{ext}"
+        digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+        rel = Path(cache_dir) / scope / f"{digest}{Path(filename).suffix}"
 
         abs_path = self.data_dir / rel
+        if abs_path.exists():
+            logger.debug("Cache hit for %d bytes → %s", len(data), rel)
+            return str(rel)
         abs_path.parent.mkdir(parents=True, exist_ok=True)
-        abs_path.write_bytes(data)
+        # Write-then-rename: a crash mid-write must never leave a truncated file
+        # under a name that later lookups would trust
+        fd, tmp_name = tempfile.mkstemp(dir=abs_path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_name, abs_path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
 
         logger.debug("Cached %d bytes → %s", len(data), rel)
         return str(rel)
@@ -271,8 +320,6 @@ class ContextBuilder:
         if user_attachments:
             user_event["attachments"] = user_attachments
 
-        self.store.append(persona_id, user_id, user_event)
-
         # Save assistant message with token usage and cost
         assistant_event: dict[str, Any] = {
             "timestamp": timestamp,
@@ -289,4 +336,4 @@ class ContextBuilder:
         if assistant_attachments:
             assistant_event["attachments"] = assistant_attachments
 
-        self.store.append(persona_id, user_id, assistant_event)
+        self.store.append_many(persona_id, user_id, [user_event, assistant_event])
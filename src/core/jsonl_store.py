@@ -1,21 +1,58 @@
 """JSONL storage for conversations - append-only logs per scope."""
 
-import json
+import functools
+import os
+from collections.abc import Iterator
 from datetime import date as date_type
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
 
+import orjson
 from zoneinfo import ZoneInfo
 
 from src.config import get_config
 from src.core.persona_id import validate_persona_id
 
+_REWIND_CHUNK_SIZE = 8192
+
+
+def _memory_clock() -> tuple[ZoneInfo, int, int]:
+    """Return (timezone, rollup hour, rollup minute) from the memory config."""
+    return _memory_clock_for(get_config().generation)
+
+
+@functools.lru_cache(maxsize=1)
+def _memory_clock_for(generation: int) -> tuple[ZoneInfo, int, int]:
+    memory_cfg = get_config().memory
+    hour, minute = (int(x) for x in memory_cfg["rollup_time"].split(":"))
+    return ZoneInfo(memory_cfg["timezone"]), hour, minute
+
+
+def _iter_lines_reversed(
+    f: BinaryIO, chunk_size: int = _REWIND_CHUNK_SIZE
+) -> Iterator[tuple[int, bytes]]:
+    """Yield (start offset, line) pairs of a binary file, last line first."""
+    pos = f.seek(0, os.SEEK_END)
+    head = b""
+    while pos > 0:
+        step = min(chunk_size, pos)
+        pos -= step
+        f.seek(pos)
+        buf = f.read(step) + head
+        parts = buf.split(b"\n")
+        end = pos + len(buf)
+        for line in reversed(parts[1:]):
+            start = end - len(line)
+            yield start, line
+            end = start - 1
+        head = parts[0]
+    yield 0, head
+
 
 def _config_now() -> datetime:
     """Return the current datetime in the config timezone."""
-    tz = ZoneInfo(get_config().memory["timezone"])
-    return datetime.now(tz)
+    return datetime.now(_memory_clock()[0])
 
 
 def _resolve_logical_date(now: datetime | None = None) -> date_type:
@@ -23,16 +60,13 @@ def _resolve_logical_date(now: datetime | None = None) -> date_type:
 
     Times before rollup_time are considered part of the previous day.
     """
-    config = get_config()
-    memory_cfg = config.memory
-    tz = ZoneInfo(memory_cfg["timezone"])
+    tz, hour, minute = _memory_clock()
 
     if now is None:
         now = datetime.now(tz)
     elif now.tzinfo is None:
         now = now.replace(tzinfo=tz)
 
-    hour, minute = (int(x) for x in memory_cfg["rollup_time"].split(":"))
     rollup_today = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
 
     if now < rollup_today:
@@ -50,6 +84,14 @@ class JSONLStore:
             data_dir = config.data_dir
         self.data_dir = data_dir
         self.conversations_dir: Path = data_dir / config.paths["conversations_dir"]
+        # Directories already created by this store; skips repeat mkdir calls
+        self._known_dirs: set[Path] = set()
+
+    def _ensure_dir(self, path: Path) -> None:
+        """Create *path* (and parents) once per store instance."""
+        if path not in self._known_dirs:
+            path.mkdir(parents=True, exist_ok=True)
+            self._known_dirs.add(path)
 
     @staticmethod
     def today() -> date_type:
@@ -81,12 +123,21 @@ class JSONLStore:
         event: dict[str, Any],
     ) -> Path:
         """Append an event to the JSONL file."""
+        return self.append_many(persona_id, user_id, [event])
+
+    def append_many(
+        self,
+        persona_id: str,
+        user_id: int,
+        events: list[dict[str, Any]],
+    ) -> Path:
+        """Append several events to the JSONL file with a single write."""
         file_path = self._get_file_path(persona_id, user_id)
-        file_path.parent.mkdir(parents=True, exist_ok=True)
+        self._ensure_dir(file_path.parent)
 
-        with open(file_path, "a", encoding="utf-8") as f:
-            json.dump(event, f, ensure_ascii=False)
-            f.write("\n")
+        data = b"".join(orjson.dumps(event) + b"\n" for event in events)
+        with open(file_path, "ab") as f:
+            f.write(data)
 
         return file_path
 
@@ -96,19 +147,28 @@ class JSONLStore:
         user_id: int,
     ) -> list[dict[str, Any]]:
         """Read all events for a persona-user pair."""
-        file_path = self._get_file_path(persona_id, user_id)
-
-        if not file_path.exists():
-            return []
+        return list(self.iter_events(persona_id, user_id))
 
-        events = []
-        with open(file_path, encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if line:
-                    events.append(json.loads(line))
+    def iter_events(self, persona_id: str, user_id: int) -> Iterator[dict[str, Any]]:
+        """Lazily yield events for a persona-user pair."""
+        return self.iter_file(self._get_file_path(persona_id, user_id))
 
-        return events
+    def tail(self, persona_id: str, user_id: int, n: int) -> list[dict[str, Any]]:
+        """Return the last ``n`` events for a persona-user pair, reading from the end."""
+        if n <= 0:
+            return []
+        lines: list[bytes] = []
+        try:
+            with open(self._get_file_path(persona_id, user_id), "rb") as f:
+                for _, line in _iter_lines_reversed(f):
+                    line = line.strip()
+                    if line:
+                        lines.append(line)
+                        if len(lines) == n:
+                            break
+        except FileNotFoundError:
+            return []
+        return [orjson.loads(line) for line in reversed(lines)]
 
     def list_scopes(self) -> list[str]:
         """List all scope directories under conversations_dir."""
@@ -122,15 +182,19 @@ class JSONLStore:
 
     def read_file(self, file_path: Path) -> list[dict[str, Any]]:
         """Read events from a specific JSONL file."""
-        if not file_path.exists():
-            return []
-        events: list[dict[str, Any]] = []
-        with open(file_path, encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if line:
-                    events.append(json.loads(line))
-        return events
+        return list(self.iter_file(file_path))
+
+    @staticmethod
+    def iter_file(file_path: Path) -> Iterator[dict[str, Any]]:
+        """Lazily yield events from a specific JSONL file."""
+        try:
+            with open(file_path, "rb") as f:
+                for line in f:
+                    line = line.strip()
+                    if line:
+                        yield orjson.loads(line)
+        except FileNotFoundError:
+            return
 
     def read_date(self, persona_id: str, user_id: int, date: datetime) -> list[dict[str, Any]]:
         """Read events for a specific date."""
@@ -146,37 +210,34 @@ class JSONLStore:
         Returns the number of events removed, or 0 if nothing to rewind.
         """
         file_path = self._get_file_path(persona_id, user_id)
-        events = self.read_file(file_path)
-        if not events:
-            return 0
-
-        # Find the last user message index
-        last_user_idx = None
-        for i in range(len(events) - 1, -1, -1):
-            if events[i].get("role") == "user":
-                last_user_idx = i
-                break
-
-        if last_user_idx is None:
+        try:
+            with open(file_path, "r+b") as f:
+                lines = _iter_lines_reversed(f)
+                removed = 0
+                cut: int | None = None
+                for offset, line in lines:
+                    if not line.strip():
+                        continue
+                    removed += 1
+                    if orjson.loads(line).get("role") == "user":
+                        cut = offset
+                        break
+
+                if cut is None:
+                    return 0
+                if any(line.strip() for _, line in lines):
+                    f.truncate(cut)
+                    return removed
+        except FileNotFoundError:
             return 0
 
-        removed = len(events) - last_user_idx
-        kept = events[:last_user_idx]
-
-        if kept:
-            with open(file_path, "w", encoding="utf-8") as f:
-                for event in kept:
-                    json.dump(event, f, ensure_ascii=False)
-                    f.write("\n")
-        elif file_path.exists():
-            file_path.unlink()
-
+        file_path.unlink(missing_ok=True)
         return removed
 
     def archive(self, file_path: Path) -> Path:
         """Move file to archive/ subdirectory within its parent."""
         archive_dir = file_path.parent / "archive"
-        archive_dir.mkdir(parents=True, exist_ok=True)
+        self._ensure_dir(archive_dir)
         dest = archive_dir / file_path.name
         if dest.exists():
             stem = file_path.stem
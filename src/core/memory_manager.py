@@ -1,7 +1,9 @@
 """Memory management - hierarchical markdown rollups (daily/weekly/monthly/seasonal/yearly)."""
 
 import calendar
+import functools
 import logging
+import os
 import re
 from datetime import date, datetime, timedelta
 from pathlib import Path
@@ -9,13 +11,15 @@ from typing import Any
 
 from src.config import get_config
 from src.core.jsonl_store import JSONLStore
-from src.providers.llm_client import LLMClient
+from src.providers.llm_client import get_llm_client
 
 logger = logging.getLogger("meowko.core.memory")
 
 # Season start months: Jan=Q1, Apr=Q2, Jul=Q3, Oct=Q4
 _SEASON_STARTS = {1, 4, 7, 10}
 _MEMORY_TAG_RE = re.compile(r"\[memory\](.*?)\[/memory\]", re.DOTALL)
+# Order memory tiers are concatenated in; unknown prefixes sort last
+_TIER_ORDER = {"year": 0, "season": 1, "month": 2, "week": 3, "day": 4}
 
 
 def estimate_tokens(text: str) -> int:
@@ -28,6 +32,7 @@ def _season_index(month: int) -> int:
     return (month - 1) // 3 + 1
 
 
+@functools.lru_cache(maxsize=1024)
 def _stem_to_date_range(stem: str) -> str:
     """Convert a memory filename stem to a human-readable date range."""
     tier, _, rest = stem.partition("-")
@@ -41,7 +46,7 @@ def _stem_to_date_range(stem: str) -> str:
         parts = rest.rsplit("-", 1)
         year = int(parts[0][:4])
         week = int(parts[1])
-        monday = datetime.strptime(f"{year}-W{week:02d}-1", "%G-W%V-%u").date()
+        monday = date.fromisocalendar(year, week, 1)
         sunday = monday + timedelta(days=6)
         return f"{monday.isoformat()} to {sunday.isoformat()}"
 
@@ -158,7 +163,7 @@ class MemoryManager:
 
     async def _llm_call(self, messages: list[dict[str, Any]], retries: int = 3) -> str:
         """Call LLM and extract [memory] block, retrying on failure."""
-        client = LLMClient()
+        client = get_llm_client()
         for attempt in range(1, retries + 1):
             try:
                 response = await client.chat(messages, temperature=0.3)
@@ -190,25 +195,21 @@ class MemoryManager:
 
         Order: year < season < month < week < day (chronological within tier).
         """
-        scope_dir = self._scope_dir(scope_id)
-        if not scope_dir.exists():
+        # One directory read; no per-file stat or glob matching
+        try:
+            with os.scandir(self._scope_dir(scope_id)) as it:
+                entries = [(e.name, e.path) for e in it if e.name.endswith(".md") and e.is_file()]
+        except FileNotFoundError:
             return ""
 
-        # Collect files by tier prefix for ordering
-        tier_order = {"year": 0, "season": 1, "month": 2, "week": 3, "day": 4}
-        files = sorted(
-            scope_dir.glob("*.md"),
-            key=lambda p: (tier_order.get(p.stem.split("-")[0], 99), p.name),
-        )
-
-        if not files:
-            return ""
+        entries.sort(key=lambda e: (_TIER_ORDER.get(e[0].split("-")[0], 99), e[0]))
 
         parts = []
-        for f in files:
-            text = f.read_text(encoding="utf-8").strip()
+        for name, path in entries:
+            with open(path, encoding="utf-8") as f:
+                text = f.read().strip()
             if text:
-                parts.append(f"## {_stem_to_date_range(f.stem)}\n{text}")
+                parts.append(f"## {_stem_to_date_range(name[:-3])}\n{text}")
         return "\n\n".join(parts)
 
     # ── Daily memory creation ──────────────────────────────────────
@@ -350,6 +351,7 @@ class MemoryManager:
     # ── Helpers ───────────────────────────────────────────────────
 
     @staticmethod
+    @functools.lru_cache(maxsize=1024)
     def _parse_scope(scope_id: str) -> tuple[str, str]:
         """Parse scope_id into (persona_id, user_id).
 
@@ -1,10 +1,12 @@
 """Validation helpers for persona IDs used in file-system paths."""
 
+import functools
 import re
 
 _PERSONA_ID_RE = re.compile(r"^[A-Za-z0-9_-]+$")
 
 
+@functools.lru_cache(maxsize=512)
 def is_valid_persona_id(persona_id: str) -> bool:
     """Return True when persona_id is safe to use in path components."""
     return bool(persona_id) and bool(_PERSONA_ID_RE.fullmatch(persona_id))
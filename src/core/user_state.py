@@ -1,16 +1,22 @@
 """YAML-backed per-user state manager."""
 
 import logging
+import os
 from pathlib import Path
 from typing import Any
 
 import yaml
 
-from src.config import get_config
+from src.config import YamlDumper, YamlLoader, get_config
 from src.core.persona_id import is_valid_persona_id
 
 logger = logging.getLogger("meowko.core.state")
 
+# State file -> ((mtime_ns, size), parsed state) as last read or written. Shared by
+# all UserState instances so a write through one is seen by the others even when
+# it lands in the same mtime tick with the same size.
+_state_cache: dict[Path, tuple[tuple[int, int], dict[str, Any]]] = {}
+
 
 class UserState:
     """Persists per-user state (e.g. active persona) to YAML files."""
@@ -25,16 +31,28 @@ class UserState:
         return self._state_dir / f"{user_id}.yaml"
 
     def _read(self, user_id: int) -> dict[str, Any]:
+        """Return the user's state, re-parsing the file only when it changed on disk."""
         path = self._user_path(user_id)
-        if not path.exists():
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            _state_cache.pop(path, None)
             return {}
+        signature = (st.st_mtime_ns, st.st_size)
+        cached = _state_cache.get(path)
+        if cached is not None and cached[0] == signature:
+            return dict(cached[1])
         with open(path, encoding="utf-8") as f:
-            return yaml.safe_load(f) or {}
+            data: dict[str, Any] = yaml.load(f, Loader=YamlLoader) or {}
+        _state_cache[path] = (signature, data)
+        return dict(data)
 
     def _write(self, user_id: int, data: dict[str, Any]) -> None:
         path = self._user_path(user_id)
         with open(path, "w", encoding="utf-8") as f:
-            yaml.safe_dump(data, f, allow_unicode=True)
+            yaml.dump(data, f, Dumper=YamlDumper, allow_unicode=True)
+        st = os.stat(path)
+        _state_cache[path] = ((st.st_mtime_ns, st.st_size), dict(data))
 
     def get_persona_id(self, user_id: int) -> str:
         """Return the user's active persona, falling back to config default."""
@@ -58,5 +76,7 @@ class UserState:
     def set_persona_id(self, user_id: int, persona_id: str) -> None:
         """Persist the user's persona selection."""
         data = self._read(user_id)
+        if data.get("persona_id") == persona_id:
+            return
         data["persona_id"] = persona_id
         self._write(user_id, data)
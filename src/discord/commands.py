@@ -7,7 +7,7 @@ import yaml
 from discord import app_commands
 from discord.ext import commands
 
-from src.config import get_config
+from src.config import YamlLoader, get_config
 from src.core.jsonl_store import JSONLStore
 from src.core.persona_id import is_valid_persona_id
 from src.core.user_state import UserState
@@ -150,7 +150,7 @@ class PersonaCommands(commands.Cog):
             nickname = pid
             if persona_yaml.exists():
                 with open(persona_yaml, encoding="utf-8") as f:
-                    data = yaml.safe_load(f) or {}
+                    data = yaml.load(f, Loader=YamlLoader) or {}
                 nickname = data.get("nickname", pid)
             marker = " **(active)**" if pid == current else ""
             lines.append(f"- `{pid}` — {nickname}{marker}")
@@ -15,8 +15,8 @@ from src.core.context_builder import ContextBuilder
 from src.core.user_state import UserState
 from src.providers.fish_audio import FishAudioTTS
 from src.providers.soniox import SonioxSTT
-from src.providers.llm_client import LLMClient, LLMResponse
-from src.providers.image_gen import ImageGenClient
+from src.providers.llm_client import LLMResponse, get_llm_client
+from src.providers.image_gen import ImageGenClient, get_image_gen_client
 
 logger = logging.getLogger("meowko.discord.handlers")
 
@@ -34,6 +34,10 @@ SUPPORTED_AUDIO_TYPES = {
     "video/mp4", "video/webm",
 }
 
+# Audio attachments larger than this are transcribed from their URL but not
+# downloaded into memory for the conversation cache.
+MAX_CACHED_AUDIO_BYTES = 25 * 1024 * 1024
+
 # Matches [tts]...[/tts] and [tti]...[/tti] blocks, preserving order.
 # Keep "tti" first and normalize to lowercase so "[tti]" can never be
 # misrouted as TTS even if tag case varies.
@@ -42,6 +46,10 @@ _BLOCK_RE = re.compile(
     re.DOTALL | re.IGNORECASE,
 )
 
+# Upper bound on messages queued behind an in-flight request for one scope.
+# Anything beyond this is dropped instead of growing the next LLM batch.
+_MAX_PENDING_PER_SCOPE = 16
+
 Segment = dict[str, Any]
 
 
@@ -56,26 +64,21 @@ class MessageHandler:
 
     def __init__(self) -> None:
         self.context_builder = ContextBuilder()
-        self.llm_client = LLMClient()
         self.stt = SonioxSTT()
         self.tts = FishAudioTTS()
         self.user_state = UserState()
-        self._tti: ImageGenClient | None = None
-        self._tti_init = False
         self._scope_locks: defaultdict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
         self._pending: defaultdict[str, list[dict[str, Any]]] = defaultdict(list)
 
     def _get_tti(self) -> ImageGenClient | None:
-        """Lazy-init the TTI client (returns None if not configured)."""
-        if not self._tti_init:
-            self._tti_init = True
-            config = get_config()
-            if config.tti.get("model"):
-                try:
-                    self._tti = ImageGenClient()
-                except Exception:
-                    logger.exception("Failed to initialize TTI client")
-        return self._tti
+        """Return the TTI client for the current config (None if not configured)."""
+        if not get_config().tti.get("model"):
+            return None
+        try:
+            return get_image_gen_client()
+        except Exception:
+            logger.exception("Failed to initialize TTI client")
+            return None
 
     # ------------------------------------------------------------------
     # Public entry point
@@ -88,12 +91,18 @@ class MessageHandler:
 
         Returns:
             An ordered list of Segments to send, or None if this message
-            was batched into another in-flight request.
+            was batched into another in-flight request or dropped because
+            too many messages are already queued for this scope.
         """
         user_id = message.author.id
         user_name = message.author.display_name
         user_text = message.content or ""
         persona_id = self.user_state.get_persona_id(user_id)
+        scope_key = f"{persona_id}-{user_id}"
+
+        # Cheap early exit; the authoritative check happens at enqueue time
+        if self._queue_full(scope_key, user_name):
+            return None
 
         # Extract media outside the lock (independent I/O)
         images = await self._extract_images(message.attachments)
@@ -117,8 +126,11 @@ class MessageHandler:
             content_parts.append(f"[Voice message: {tr['text']}]")
         text_line = format_user_message(user_name, " ".join(content_parts))
 
+        # Re-check after the extraction awaits; nothing below yields until appended
+        if self._queue_full(scope_key, user_name):
+            return None
+
         # Enqueue and let the lock holder batch us
-        scope_key = f"{persona_id}-{user_id}"
         future: asyncio.Future[list[Segment]] = (
             asyncio.get_running_loop().create_future()
         )
@@ -131,10 +143,13 @@ class MessageHandler:
 
         async with self._scope_locks[scope_key]:
             if future.done():
+                # Batched into an earlier holder's request, which reports any failure
+                future.exception()
                 return None
 
-            batch = list(self._pending[scope_key])
-            self._pending[scope_key].clear()
+            batch = self._pending.pop(scope_key, [])
+            if not batch:
+                return None
 
             if len(batch) > 1:
                 logger.info(
@@ -142,7 +157,14 @@ class MessageHandler:
                     len(batch), scope_key,
                 )
 
-            result = await self._process_batch(batch, user_id, persona_id)
+            try:
+                result = await self._process_batch(batch, user_id, persona_id)
+            except Exception as e:
+                # Our own future is skipped: the failure reaches this caller via raise
+                for item in batch:
+                    if item["future"] is not future and not item["future"].done():
+                        item["future"].set_exception(e)
+                raise
 
             for item in batch:
                 if not item["future"].done():
@@ -150,6 +172,17 @@ class MessageHandler:
 
         return result
 
+    def _queue_full(self, scope_key: str, user_name: str) -> bool:
+        """Return True (and log the drop) if the scope's pending queue is at its cap."""
+        pending = len(self._pending.get(scope_key, ()))
+        if pending < _MAX_PENDING_PER_SCOPE:
+            return False
+        logger.warning(
+            "Dropping message from %s: %d messages already pending for scope %s",
+            user_name, pending, scope_key,
+        )
+        return True
+
     # ------------------------------------------------------------------
     # Batch processing
     # ------------------------------------------------------------------
@@ -191,7 +224,7 @@ class MessageHandler:
 
         # LLM call
         try:
-            llm_response: LLMResponse = await self.llm_client.chat(context)
+            llm_response: LLMResponse = await get_llm_client().chat(context)
         except Exception as e:
             logger.exception("Error getting LLM response")
             return [{"type": "text", "content": f"Sorry, I encountered an error: {e}"}]
@@ -213,6 +246,8 @@ class MessageHandler:
                 "path": path,
             })
         for af in all_audio_files:
+            if af["raw_bytes"] is None:
+                continue
             path = self.context_builder.save_cache_file(
                 persona_id, user_id, af["filename"], af["raw_bytes"],
             )
@@ -281,7 +316,7 @@ class MessageHandler:
             return []
 
         # 2. Launch TTS / TTI tasks in parallel
-        tti_client = self._get_tti()
+        tti_client = self._get_tti() if any(kind == "tti" for kind, _ in raw) else None
         tasks: dict[int, asyncio.Task[bytes]] = {}
         for i, (kind, content) in enumerate(raw):
             if kind == "tts" and content:
@@ -374,7 +409,14 @@ class MessageHandler:
             try:
                 text = await self.stt.transcribe(attachment.url)
                 if text:
-                    audio_bytes = await attachment.read()
+                    audio_bytes: bytes | None = None
+                    if attachment.size <= MAX_CACHED_AUDIO_BYTES:
+                        audio_bytes = await attachment.read()
+                    else:
+                        logger.warning(
+                            "Not caching oversized audio %s (%d bytes)",
+                            attachment.filename, attachment.size,
+                        )
                     transcripts.append({
                         "filename": attachment.filename,
                         "text": text,
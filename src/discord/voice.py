@@ -9,15 +9,17 @@ Data flow:
     → LLMClient.chat_stream() (streaming tokens)
     → _TagStripper (incremental tag removal)
     → FishAudioStreamingTTS WebSocket (44.1kHz PCM → resample → 48kHz)
-    → AudioResampler.tts_to_discord() (48kHz mono → 48kHz stereo)
+    → PCMStreamSource.feed_mono() (48kHz mono → 48kHz stereo, upmixed in place)
     → PCMStreamSource buffer → VoiceClient.play()
 """
 
 import asyncio
 import logging
 import re
+import socket
 import time
-from collections.abc import AsyncIterable
+from collections import defaultdict, deque
+from collections.abc import AsyncIterable, Callable
 
 import discord
 from discord.ext.voice_recv import BasicSink, VoiceRecvClient
@@ -26,21 +28,30 @@ from src.config import get_config
 from src.core.context_builder import ContextBuilder
 from src.core.user_state import UserState
 from src.discord.handlers import format_user_message
-from src.media.audio import AudioResampler, PCMStreamSource, generate_ding
+from src.media.audio import (
+    AudioResampler,
+    PCMStreamSource,
+    StereoDownmixer,
+    generate_ding,
+    is_silent,
+)
 from src.providers.fish_audio import FishAudioStreamingTTS
 from src.providers.soniox import SonioxStreamingSTT
-from src.providers.llm_client import LLMClient
+from src.providers.llm_client import get_llm_client
 
 logger = logging.getLogger("meowko.discord.voice")
 
-# Tag patterns for stripping LLM output for voice (used for text channel echo)
-_TTI_BLOCK_RE = re.compile(r"\[tti\].*?\[/tti\]", re.DOTALL)
-_TTS_TAG_RE = re.compile(r"\[/?tts\]")
-
-# Tags the incremental stripper recognises
+# Tags the tag strippers recognise
 _KNOWN_TAGS = {"[tti]", "[/tti]", "[tts]", "[/tts]"}
+_TAG_RE = re.compile(r"\[/?tt[is]\]")
 _MAX_TAG_LEN = 6  # len("[/tti]")
 
+# Cap on audio buffered while STT connects: ~20s of 48kHz mono 16-bit
+_MAX_PRECONNECT_BUFFER_BYTES = 1920000
+
+# Acknowledgement ding, synthesized once as ready-to-play 48kHz stereo PCM
+_DING_PCM = generate_ding()
+
 
 class _TagStripper:
     """Incremental filter that strips [tts]/[/tts] tags and suppresses [tti]...[/tti] blocks.
@@ -63,54 +74,37 @@ class _TagStripper:
         return result
 
     def _drain(self) -> str:
+        buf = self._buf
         out: list[str] = []
-        while self._buf:
+        pos = 0
+        while True:
             if self._in_tti:
-                idx = self._buf.find("[/tti]")
-                if idx >= 0:
-                    self._buf = self._buf[idx + 6:]
-                    self._in_tti = False
-                    continue
-                # Keep last (_MAX_TAG_LEN - 1) chars for partial closing-tag match
-                keep = _MAX_TAG_LEN - 1
-                if len(self._buf) > keep:
-                    self._buf = self._buf[-keep:]
-                break
-
-            bracket = self._buf.find("[")
-            if bracket < 0:
-                out.append(self._buf)
-                self._buf = ""
-                break
-
-            if bracket > 0:
-                out.append(self._buf[:bracket])
-                self._buf = self._buf[bracket:]
-
-            # Buffer starts with "["
-            if self._buf.startswith("[tti]"):
-                self._in_tti = True
-                self._buf = self._buf[5:]
-                continue
-            if self._buf.startswith("[tts]"):
-                self._buf = self._buf[5:]
-                continue
-            if self._buf.startswith("[/tts]"):
-                self._buf = self._buf[6:]
-                continue
-            if self._buf.startswith("[/tti]"):
-                # Orphaned closing tag — skip
-                self._buf = self._buf[6:]
+                end = buf.find("[/tti]", pos)
+                if end < 0:
+                    # Keep last (_MAX_TAG_LEN - 1) chars for partial closing-tag match
+                    self._buf = buf[max(pos, len(buf) - (_MAX_TAG_LEN - 1)):]
+                    return "".join(out)
+                pos = end + len("[/tti]")
+                self._in_tti = False
                 continue
 
-            # Could still be the start of a known tag — wait for more input
-            if any(tag.startswith(self._buf) for tag in _KNOWN_TAGS):
+            m = _TAG_RE.search(buf, pos)
+            if m is None:
                 break
+            out.append(buf[pos:m.start()])
+            # [tts]/[/tts] and orphaned [/tti] are dropped; [tti] opens a block
+            if m.group() == "[tti]":
+                self._in_tti = True
+            pos = m.end()
 
-            # Not a recognised tag — emit the "[" and continue
-            out.append("[")
-            self._buf = self._buf[1:]
-
+        # Hold back a trailing "[..." that could still become a known tag
+        tail = buf.rfind("[", max(pos, len(buf) - (_MAX_TAG_LEN - 1)))
+        if tail >= 0 and any(tag.startswith(buf[tail:]) for tag in _KNOWN_TAGS):
+            out.append(buf[pos:tail])
+            self._buf = buf[tail:]
+        else:
+            out.append(buf[pos:])
+            self._buf = ""
         return "".join(out)
 
 
@@ -125,37 +119,50 @@ class UserAudioStream:
         self.user = user
         self.session = session
         self._stt: SonioxStreamingSTT | None = None
+        self._silence_handle: asyncio.TimerHandle | None = None
         self._silence_task: asyncio.Task[None] | None = None
         self._connecting = False
         self._connected_event = asyncio.Event()
-        self._audio_buffer: list[bytes] = []
-        self._audio_buffer_bytes = 0
-        self._pending_tasks: set[asyncio.Task[None]] = set()
-
-        config = get_config()
-        self._endpointing_secs = config.voice.get("endpointing_ms", 500) / 1000.0
-        # Cap buffer at ~20s of 48kHz mono 16-bit audio (1920000 bytes)
-        self._max_buffer_bytes = 1920000
+        self._connect_task: asyncio.Task[None] | None = None
+        self._audio_buffer = bytearray()
+        self._send_buffer = bytearray()
+        self._send_buffer_since = 0.0
+        self._downmixer = StereoDownmixer()
+        self._transcripts: asyncio.Queue[str] = asyncio.Queue()
+        self._transcript_task: asyncio.Task[None] | None = None
 
     async def ensure_connected(self) -> None:
         """Lazy-connect (or reconnect) the STT WebSocket."""
-        # Check if existing connection is still alive
-        if self._connected_event.is_set() and self._stt and self._stt._connected:
-            return
-        # Need to (re)connect
         if self._connected_event.is_set():
-            # Was connected before but dropped — clean up old state
-            self._connected_event.clear()
-            self._connecting = False
-            if self._stt:
-                await self._stt.close()
-                self._stt = None
-            logger.info("STT connection lost for %s, reconnecting", self.user.display_name)
+            # Check if existing connection is still alive
+            if self._stt and self._stt._connected:
+                return
+            # Was connected before but dropped
+            stale = self._mark_dropped()
+            self._connecting = True
+            await self._connect(stale)
+            return
         if self._connecting:
             # Another coroutine is connecting — wait for it
             await self._connected_event.wait()
             return
         self._connecting = True
+        await self._connect()
+
+    def _mark_dropped(self) -> SonioxStreamingSTT | None:
+        """Reset state after the STT stream dropped; return the old stream to close."""
+        self._connected_event.clear()
+        stale, self._stt = self._stt, None
+        # Unsent audio goes ahead of whatever is buffered during the reconnect
+        self._audio_buffer[:0] = self._send_buffer
+        self._send_buffer = bytearray()
+        logger.info("STT connection lost for %s, reconnecting", self.user.display_name)
+        return stale
+
+    async def _connect(self, stale: SonioxStreamingSTT | None = None) -> None:
+        """Open a new STT stream and flush buffered audio; caller sets _connecting."""
+        if stale:
+            await stale.close()
         try:
             self._stt = SonioxStreamingSTT(
                 on_committed=self._on_committed,
@@ -172,78 +179,109 @@ class UserAudioStream:
         self._connecting = False
         logger.info("STT stream connected for user %s", self.user.display_name)
 
-        # Flush any audio buffered during connection
-        for chunk in self._audio_buffer:
-            await self._stt.send_audio(chunk)
-        self._audio_buffer.clear()
-        self._audio_buffer_bytes = 0
+        # Flush any audio buffered during connection in a single frame
+        if self._audio_buffer:
+            buffered, self._audio_buffer = self._audio_buffer, bytearray()
+            await self._stt.send_audio(buffered)
 
     async def feed_audio(self, pcm_48k_stereo: bytes) -> None:
         """Resample and send audio to STT. Also check for barge-in."""
+        # Pure silence carries nothing for STT and must not count as speech
+        # for barge-in or the endpointing timer.
+        if is_silent(pcm_48k_stereo):
+            return
+
         # Barge-in: interrupt playback once, not on every frame
         if self.session.is_playing():
             self.session.interrupt_playback()
 
-        pcm_48k_mono = AudioResampler.discord_to_stt(pcm_48k_stereo)
-
-        # Reconnect if the STT WebSocket dropped
+        # Reconnect in the background if the STT WebSocket dropped; frames are
+        # buffered below meanwhile, so routing for the guild never waits on it
         if self._connected_event.is_set() and (not self._stt or not self._stt._connected):
-            await self.ensure_connected()
+            stale = self._mark_dropped()
+            self._connecting = True
+            self._connect_task = asyncio.create_task(self._connect(stale))
 
         if not self._connected_event.is_set():
             # Buffer audio while connecting (with cap)
-            if self._audio_buffer_bytes < self._max_buffer_bytes:
-                self._audio_buffer.append(pcm_48k_mono)
-                self._audio_buffer_bytes += len(pcm_48k_mono)
+            # Mono output is half the stereo input; never overshoot the cap
+            if len(self._audio_buffer) + len(pcm_48k_stereo) // 2 <= _MAX_PRECONNECT_BUFFER_BYTES:
+                self._downmixer.downmix_into(pcm_48k_stereo, self._audio_buffer)
             # Kick off connection if not started
             if not self._connecting:
-                asyncio.create_task(self.ensure_connected())
+                self._connect_task = asyncio.create_task(self.ensure_connected())
             self._reset_silence_timer()
             return
 
-        assert self._stt is not None
-        await self._stt.send_audio(pcm_48k_mono)
+        if not self._send_buffer:
+            self._send_buffer_since = time.monotonic()
+        self._downmixer.downmix_into(pcm_48k_stereo, self._send_buffer)
+        if (
+            len(self._send_buffer) >= self.session.stt_send_bytes
+            or time.monotonic() - self._send_buffer_since >= self.session.stt_send_max_delay
+        ):
+            await self._flush_send_buffer()
         self._reset_silence_timer()
 
+    async def _flush_send_buffer(self) -> None:
+        """Send all coalesced audio to STT as one frame."""
+        if not self._send_buffer or not self._stt:
+            return
+        # Swap rather than copy: the filled buffer is handed to the socket as-is
+        chunk, self._send_buffer = self._send_buffer, bytearray()
+        await self._stt.send_audio(chunk)
+
     def _reset_silence_timer(self) -> None:
         """Reset the silence timer — end stream after endpointing_ms of no audio."""
-        if self._silence_task and not self._silence_task.done():
-            self._silence_task.cancel()
-        self._silence_task = asyncio.create_task(self._silence_timeout())
+        if self._silence_handle:
+            self._silence_handle.cancel()
+        self._silence_handle = asyncio.get_running_loop().call_later(
+            self.session.endpointing_secs, self._on_silence,
+        )
 
-    async def _silence_timeout(self) -> None:
-        """Wait for silence duration, then end the stream to finalise the transcript."""
-        try:
-            await asyncio.sleep(self._endpointing_secs)
-            if self._stt and self._stt._connected:
-                await self._stt.end_stream()
-        except asyncio.CancelledError:
-            pass
+    def _on_silence(self) -> None:
+        """Timer callback — only now spawn a task to end the stream."""
+        self._silence_handle = None
+        self._silence_task = asyncio.create_task(self._end_stream_on_silence())
+
+    async def _end_stream_on_silence(self) -> None:
+        """Flush pending audio and end the stream to finalise the transcript."""
+        if self._stt and self._stt._connected:
+            await self._flush_send_buffer()
+            await self._stt.end_stream()
 
     async def _on_committed(self, text: str) -> None:
-        """Forward committed transcript to the voice session.
+        """Queue a committed transcript for the voice session.
 
-        Launched as a task so it doesn't block the STT receive loop.
+        Handled by a long-lived consumer so it doesn't block the STT receive loop.
         """
         logger.info("STT committed [%s]: %s", self.user.display_name, text)
-        task = asyncio.create_task(self._handle_committed(text))
-        self._pending_tasks.add(task)
-        task.add_done_callback(self._pending_tasks.discard)
-
-    async def _handle_committed(self, text: str) -> None:
-        try:
-            await self.session.handle_transcript(self.user, text)
-        except Exception as e:
-            logger.error("Error handling transcript: %r", e)
+        self._transcripts.put_nowait(text)
+        if self._transcript_task is None:
+            self._transcript_task = asyncio.create_task(self._transcript_consumer())
+
+    async def _transcript_consumer(self) -> None:
+        """Forward queued transcripts to the voice session one at a time."""
+        while True:
+            text = await self._transcripts.get()
+            try:
+                await self.session.handle_transcript(self.user, text)
+            except Exception as e:
+                logger.error("Error handling transcript: %r", e)
 
     async def close(self) -> None:
         """Tear down the STT WebSocket and cancel pending tasks."""
+        if self._silence_handle:
+            self._silence_handle.cancel()
+            self._silence_handle = None
         if self._silence_task and not self._silence_task.done():
             self._silence_task.cancel()
-        for task in self._pending_tasks:
-            if not task.done():
-                task.cancel()
-        self._pending_tasks.clear()
+        if self._transcript_task:
+            self._transcript_task.cancel()
+            self._transcript_task = None
+        if self._connect_task and not self._connect_task.done():
+            self._connect_task.cancel()
+        self._connect_task = None
         if self._stt:
             await self._stt.close()
             self._stt = None
@@ -252,31 +290,61 @@ class UserAudioStream:
 class VoiceSession:
     """Per-guild voice session — orchestrates STT → LLM → TTS → playback."""
 
-    def __init__(self, guild: discord.Guild) -> None:
+    def __init__(
+        self,
+        guild: discord.Guild,
+        context_builder: ContextBuilder | None = None,
+        user_state: UserState | None = None,
+    ) -> None:
         self.guild = guild
         self.voice_client: VoiceRecvClient | None = None
         self._user_streams: dict[int, UserAudioStream] = {}
-        self._processing_lock = asyncio.Lock()
+        # Turns are serialized per user (history order); only playback of the
+        # shared voice client is serialized across users.
+        self._user_locks: defaultdict[int, asyncio.Lock] = defaultdict(asyncio.Lock)
+        self._playback_lock = asyncio.Lock()
         self._current_source: PCMStreamSource | None = None
+        self._playing = False
         self._loop: asyncio.AbstractEventLoop | None = None
         self._health_task: asyncio.Task[None] | None = None
         self._last_frame_time: float = 0.0
         self._last_listener_restart: float = 0.0
         self._listener_generation: int = 0
         self._voice_ws_fingerprint: tuple[int | None, str | None, str | None] | None = None
-
-        self._context_builder = ContextBuilder()
-        self._llm_client = LLMClient()
-        self._user_state = UserState()
-        self._ding_pcm = generate_ding()
+        # Frames handed over from the voice receive thread, drained by _rx_task.
+        # A wake-up is only scheduled when none is pending, so a burst of
+        # frames costs one loop wake-up instead of one per frame.
+        self._rx_queue: deque[tuple[discord.Member | discord.User, bytes]] = deque(maxlen=1024)
+        self._rx_wake = asyncio.Event()
+        self._rx_wake_pending = False
+        self._rx_task: asyncio.Task[None] | None = None
+        self._reader: object | None = None
+        self._update_secret_key: Callable[[bytes], None] | None = None
+        self._reader_is_listening: Callable[[], bool] | None = None
+        self._stop_playing: Callable[[], None] | None = None
+        voice_cfg = get_config().voice
+        self.endpointing_secs = voice_cfg.get("endpointing_ms", 500) / 1000.0
+        # Coalesce 20 ms frames into larger STT sends: flush once stt_batch_ms of
+        # 48kHz mono 16-bit audio (96 bytes/ms) is queued or the oldest byte is that old.
+        stt_batch_ms = voice_cfg.get("stt_batch_ms", 60)
+        self.stt_send_bytes = stt_batch_ms * 96
+        self.stt_send_max_delay = stt_batch_ms / 1000.0
+
+        self._context_builder = context_builder or ContextBuilder()
+        self._user_state = user_state or UserState()
+        # Audio for the current turn accumulates here for caching
+        self._tts_pcm = bytearray()
 
     async def join(self, channel: discord.VoiceChannel | discord.StageChannel) -> None:
         """Connect to a voice channel and start listening."""
         self._loop = asyncio.get_running_loop()
         self.voice_client = await channel.connect(cls=VoiceRecvClient)
+        # VoiceRecvClient.stop() also stops listening; prefer stop_playing()
+        self._stop_playing = getattr(self.voice_client, "stop_playing", None)
         self._voice_ws_fingerprint = self._capture_voice_ws_fingerprint()
 
         self._frame_count = 0
+        self._rx_task = asyncio.create_task(self._rx_consumer())
         self._start_listening()
         self._health_task = asyncio.create_task(self._health_monitor())
         logger.info("Joined voice channel: %s (guild: %s)", channel.name, self.guild.name)
@@ -299,22 +367,30 @@ class VoiceSession:
                 return
             if user is None or user.bot:
                 return
-            self._last_frame_time = time.monotonic()
-            self._frame_count += 1
-            if self._frame_count % 50 == 1:
-                logger.info("Voice frame %d from %s (%d bytes)", self._frame_count, user, len(data.pcm))
-            # BasicSink callback runs in a thread — schedule coroutine on event loop
-            assert self._loop is not None
-            asyncio.run_coroutine_threadsafe(
-                self._on_audio_frame(user, data.pcm), self._loop,
-            )
+            # BasicSink callback runs in the decode thread — keep it minimal and
+            # hand the frame to the event loop; bookkeeping happens in _rx_consumer
+            self._rx_queue.append((user, data.pcm))
+            if not self._rx_wake_pending:
+                self._rx_wake_pending = True
+                assert self._loop is not None
+                self._loop.call_soon_threadsafe(self._rx_wake.set)
 
         self.voice_client.stop_listening()
         self._drain_stale_voice_packets()
         self.voice_client.listen(BasicSink(on_audio))
+        self._bind_reader(getattr(self.voice_client, "_reader", None))
         logger.info("Voice listener started (guild: %s)", self.guild.name)
 
-    def _drain_stale_voice_packets(self, max_packets: int = 256) -> None:
+    def _bind_reader(self, reader: object | None) -> None:
+        """Resolve the reader's hooks once rather than probing them on every check."""
+        if reader == "MISSING":
+            reader = None
+        self._reader = reader
+        self._update_secret_key = getattr(reader, "update_secret_key", None)
+        is_listening = getattr(reader, "is_listening", None)
+        self._reader_is_listening = is_listening if callable(is_listening) else None
+
+    def _drain_stale_voice_packets(self, max_packets: int = 256, max_seconds: float = 0.005) -> None:
         """Drop queued UDP packets that may belong to an old voice session key."""
         vc = self.voice_client
         if not vc:
@@ -324,10 +400,14 @@ class VoiceSession:
         if not sock:
             return
 
+        # MSG_DONTWAIT never blocks the loop, whatever the socket's own mode
+        flags = getattr(socket, "MSG_DONTWAIT", 0)
+        buf = bytearray(2048)
+        deadline = time.monotonic() + max_seconds
         drained = 0
-        while drained < max_packets:
+        while drained < max_packets and time.monotonic() < deadline:
             try:
-                sock.recv(2048)
+                sock.recv_into(buf, 0, flags)
             except (BlockingIOError, InterruptedError):
                 break
             except OSError:
@@ -346,6 +426,10 @@ class VoiceSession:
         if self._health_task and not self._health_task.done():
             self._health_task.cancel()
             self._health_task = None
+        if self._rx_task and not self._rx_task.done():
+            self._rx_task.cancel()
+            self._rx_task = None
+        self._rx_queue.clear()
         for stream in self._user_streams.values():
             await stream.close()
         self._user_streams.clear()
@@ -356,42 +440,58 @@ class VoiceSession:
         self._voice_ws_fingerprint = None
         logger.info("Left voice channel (guild: %s)", self.guild.name)
 
+    async def _rx_consumer(self) -> None:
+        """Route frames queued by the receive thread, in arrival order."""
+        queue = self._rx_queue
+        while True:
+            await self._rx_wake.wait()
+            self._rx_wake.clear()
+            # Reset before draining so a frame appended mid-drain schedules a new wake-up
+            self._rx_wake_pending = False
+            self._last_frame_time = time.monotonic()
+            while queue:
+                user, pcm = queue.popleft()
+                self._frame_count += 1
+                if self._frame_count % 50 == 1 and logger.isEnabledFor(logging.INFO):
+                    logger.info("Voice frame %d from %s (%d bytes)", self._frame_count, user, len(pcm))
+                try:
+                    await self._on_audio_frame(user, pcm)
+                except Exception:
+                    logger.exception("Error routing voice frame from %s", user)
+
     async def _on_audio_frame(self, user: discord.Member | discord.User, pcm_data: bytes) -> None:
         """Route incoming audio to the correct user stream."""
-        user_id = user.id
-        if user_id not in self._user_streams:
-            member = self.guild.get_member(user_id)
+        stream = self._user_streams.get(user.id)
+        if stream is None:
+            member = self.guild.get_member(user.id)
             if member is None:
                 return
-            self._user_streams[user_id] = UserAudioStream(member, self)
-        await self._user_streams[user_id].feed_audio(pcm_data)
+            stream = self._user_streams[user.id] = UserAudioStream(member, self)
+        await stream.feed_audio(pcm_data)
 
     def is_playing(self) -> bool:
-        """Check if the bot is currently playing audio."""
-        return (
-            self.voice_client is not None
-            and self.voice_client.is_playing()
-        )
+        """Check if a TTS reply is currently playing (cheap enough to call per frame)."""
+        return self._playing
 
     def interrupt_playback(self) -> None:
         """Barge-in — stop current playback immediately (idempotent)."""
         if not self._current_source:
             return
+        self._playing = False
         self._current_source.interrupt()
         self._current_source = None
         if self.voice_client and self.voice_client.is_playing():
             # VoiceRecvClient.stop() also stops listening; use stop_playing() so
             # receive stays active while interrupting TTS playback.
-            stop_playing = getattr(self.voice_client, "stop_playing", None)
-            if callable(stop_playing):
-                stop_playing()
+            if self._stop_playing is not None:
+                self._stop_playing()
             else:
                 self.voice_client.stop()
         logger.debug("Playback interrupted (barge-in)")
 
     async def handle_transcript(self, user: discord.Member, text: str) -> None:
-        """Process a committed transcript — serialized one at a time."""
-        async with self._processing_lock:
+        """Process a committed transcript — serialized per user."""
+        async with self._user_locks[user.id]:
             await self._process_voice_turn(user, text)
 
     async def _play_ding(self) -> None:
@@ -402,7 +502,7 @@ class VoiceSession:
             self.voice_client.stop()
 
         source = PCMStreamSource()
-        source.feed(self._ding_pcm)
+        source.feed(_DING_PCM)
         source.finish()
 
         done = asyncio.Event()
@@ -421,9 +521,14 @@ class VoiceSession:
 
         LLM tokens are piped through a tag stripper directly into the Fish Audio
         WebSocket TTS, so audio generation begins as soon as the first tokens
-        arrive rather than waiting for the full LLM response.
+        arrive rather than waiting for the full LLM response. Context building
+        and the LLM request run outside the playback lock, so one user's turn
+        can start while another's reply is still playing.
         """
-        await self._play_ding()
+        # Don't cut into another user's reply with the acknowledgement ding
+        if not self._playback_lock.locked():
+            async with self._playback_lock:
+                await self._play_ding()
 
         user_id = user.id
         user_name = user.display_name
@@ -442,16 +547,29 @@ class VoiceSession:
         context.append({"role": "user", "content": user_message})
 
         try:
-            llm_stream = await self._llm_client.chat_stream(context)
+            llm_stream = await get_llm_client().chat_stream(context)
         except Exception:
             logger.exception("LLM error during voice turn")
             return
 
+        # Read the LLM stream into a queue right away, so it is never left idle
+        # (and timed out) while another user's reply holds the playback lock
+        tokens: asyncio.Queue[str | None] = asyncio.Queue()
+
+        async def pump_tokens() -> None:
+            try:
+                async for token in llm_stream:
+                    tokens.put_nowait(token)
+            finally:
+                tokens.put_nowait(None)
+
+        pump_task = asyncio.create_task(pump_tokens())
+
         # Pipe LLM tokens through tag stripper → TTS WebSocket
         stripper = _TagStripper()
 
         async def stripped_tokens() -> AsyncIterable[str]:
-            async for token in llm_stream:
+            while (token := await tokens.get()) is not None:
                 clean = stripper.feed(token)
                 if clean:
                     yield clean
@@ -459,22 +577,23 @@ class VoiceSession:
             if remaining:
                 yield remaining
 
-        # Stream TTS and play concurrently with LLM generation
-        pcm_data = await self._stream_tts_and_play(stripped_tokens(), voice_id)
-
-        # TTS may fail early; drain remaining LLM tokens so response stats are populated.
-        if llm_stream.response is None:
-            try:
-                async for _ in llm_stream:
-                    pass
-            except Exception:
-                logger.exception("Failed draining LLM stream after TTS error")
+        pcm_data: bytearray | None = None
+        try:
+            # Stream TTS and play concurrently with LLM generation
+            async with self._playback_lock:
+                pcm_data = await self._stream_tts_and_play(stripped_tokens(), voice_id)
+            # TTS may stop early; the pump still reads the rest so stats are populated
+            await pump_task
+        except Exception:
+            logger.exception("LLM stream failed during voice turn")
+        finally:
+            pump_task.cancel()
 
         llm_response = llm_stream.response
         if llm_response is None:
             # Last-resort fallback: run non-streaming completion so the turn is not lost.
             try:
-                llm_response = await self._llm_client.chat(context)
+                llm_response = await get_llm_client().chat(context)
                 logger.warning("Recovered voice turn with non-streaming LLM fallback")
             except Exception:
                 logger.exception("LLM fallback failed after TTS stream error")
@@ -522,7 +641,7 @@ class VoiceSession:
         self,
         text_stream: AsyncIterable[str],
         voice_id: str | None = None,
-    ) -> bytes | None:
+    ) -> bytearray | None:
         """Create PCMStreamSource, start playback, feed TTS audio, wait for finish.
 
         Returns the raw 48kHz mono PCM audio data for caching, or None on failure.
@@ -536,35 +655,35 @@ class VoiceSession:
 
         source = PCMStreamSource()
         self._current_source = source
-
-        raw_pcm_chunks: list[bytes] = []
-
-        async def on_audio(pcm_48k: bytes) -> None:
-            raw_pcm_chunks.append(pcm_48k)
-            pcm_48k_stereo = AudioResampler.tts_to_discord(pcm_48k)
-            source.feed(pcm_48k_stereo)
-
-        tts = FishAudioStreamingTTS(on_audio=on_audio)
+        self._tts_pcm = bytearray()
 
         # Start playback immediately — PCMStreamSource returns silence on underrun
         playback_done = asyncio.Event()
 
+        def on_playback_done() -> None:
+            if self._current_source is source:
+                self._playing = False
+            playback_done.set()
+
         def after_playback(error: Exception | None) -> None:
             if error:
                 logger.error("Playback error: %s", error)
             if self._loop:
-                self._loop.call_soon_threadsafe(playback_done.set)
+                self._loop.call_soon_threadsafe(on_playback_done)
 
+        self._playing = True
         self.voice_client.play(source, after=after_playback)
 
         # Stream TTS audio into the source concurrently with playback
         try:
+            # Built per turn so config reloads apply; the SDK client underneath
+            # (and its connection pool) is shared per API key
+            tts = FishAudioStreamingTTS(on_audio=self._on_tts_audio)
             await tts.synthesize_streaming(text_stream, voice_id=voice_id)
         except Exception:
             logger.exception("Streaming TTS error")
         finally:
             source.finish()
-            await tts.close()
 
         # Wait for playback to drain the buffer
         await playback_done.wait()
@@ -577,19 +696,23 @@ class VoiceSession:
         # This is non-destructive — no listener restart, no packet loss.
         self._refresh_reader_key()
 
-        return b"".join(raw_pcm_chunks) if raw_pcm_chunks else None
+        return self._tts_pcm or None
+
+    async def _on_tts_audio(self, pcm_48k: bytes) -> None:
+        """Collect a TTS chunk for caching and feed it to the active source."""
+        self._tts_pcm += pcm_48k
+        if self._current_source:
+            self._current_source.feed_mono(pcm_48k)
 
     def _refresh_reader_key(self) -> None:
         """Update the voice reader's decryptor with the current secret key."""
         vc = self.voice_client
-        if not vc:
+        if not vc or not self._update_secret_key:
             return
-        reader = getattr(vc, '_reader', None)
-        if reader and hasattr(reader, 'update_secret_key'):
-            try:
-                reader.update_secret_key(bytes(vc.secret_key))
-            except Exception:
-                logger.debug("Failed to refresh reader secret key", exc_info=True)
+        try:
+            self._update_secret_key(bytes(vc.secret_key))
+        except Exception:
+            logger.debug("Failed to refresh reader secret key", exc_info=True)
 
     async def _health_monitor(self) -> None:
         """Periodically check voice receive pipeline health."""
@@ -622,6 +745,12 @@ class VoiceSession:
         if not vc or not vc.is_connected():
             return
 
+        # The library may swap readers on reconnect; rebind the cached hooks
+        reader = getattr(vc, "_reader", None)
+        if reader is not self._reader:
+            self._bind_reader(reader)
+        reader = self._reader
+
         # Keep reader decrypt state aligned with the latest voice secret key.
         # This is cheap and avoids decrypt drift after transient reconnects.
         self._refresh_reader_key()
@@ -643,16 +772,15 @@ class VoiceSession:
             self._voice_ws_fingerprint = current_fingerprint
 
         # Check if the reader is alive — if MISSING or not listening, restart
-        reader = getattr(vc, '_reader', None)
-        if not reader or reader == "MISSING":
+        if not reader:
             now = time.monotonic()
             if now - self._last_listener_restart > 10:
                 logger.warning("Voice reader is missing, restarting listener (guild: %s)", self.guild.name)
                 self._start_listening()
         else:
             is_listening = True
-            if hasattr(reader, "is_listening") and callable(reader.is_listening):
-                is_listening = bool(reader.is_listening())
+            if self._reader_is_listening is not None:
+                is_listening = bool(self._reader_is_listening())
             elif hasattr(reader, "active"):
                 is_listening = bool(getattr(reader, "active"))
             if not is_listening:
@@ -661,9 +789,6 @@ class VoiceSession:
                     logger.warning("Voice reader is not listening, restarting listener (guild: %s)", self.guild.name)
                     self._start_listening()
 
-        # Proactively refresh the decryptor's secret key
-        self._refresh_reader_key()
-
         # Recover from stale listener after prolonged silence.
         # Discord voice gateway can silently reconnect during idle, leaving
         # the reader alive but detached from our BasicSink callback.
@@ -690,13 +815,30 @@ class VoiceSession:
 
     @staticmethod
     def _strip_tags(text: str) -> str:
-        """Remove [tti]...[/tti] blocks entirely, strip [tts]/[/tts] tags keeping content."""
-        # Remove tti blocks completely
-        text = _TTI_BLOCK_RE.sub("", text)
-        # Strip tts tags but keep content
-        text = _TTS_TAG_RE.sub("", text)
-        return text.strip()
+        """Remove [tti]...[/tti] blocks entirely, strip [tts]/[/tts] tags keeping content.
 
+        Unclosed [tti] and orphaned [/tti] tags are left as-is. Runs in linear
+        time: once no closing tag remains, later [tti] tags skip the search.
+        """
+        out: list[str] = []
+        pos = 0
+        has_close = True
+        while (m := _TAG_RE.search(text, pos)) is not None:
+            tag = m.group()
+            if tag == "[tti]" and has_close:
+                end = text.find("[/tti]", m.end())
+                if end >= 0:
+                    out.append(text[pos:m.start()])
+                    pos = end + len("[/tti]")
+                    continue
+                has_close = False
+            if tag in ("[tti]", "[/tti]"):
+                out.append(text[pos:m.end()])
+            else:
+                out.append(text[pos:m.start()])
+            pos = m.end()
+        out.append(text[pos:])
+        return "".join(out).strip()
 
 
 class VoiceSessionManager:
@@ -704,6 +846,10 @@ class VoiceSessionManager:
 
     def __init__(self) -> None:
         self._sessions: dict[int, VoiceSession] = {}
+        # Shared by all guild sessions so the persona cache is reused across
+        # guilds and rejoins.
+        self._context_builder = ContextBuilder()
+        self._user_state = UserState()
 
     async def join(self, channel: discord.VoiceChannel | discord.StageChannel) -> VoiceSession:
         """Create or reuse a voice session for the channel's guild."""
@@ -716,7 +862,11 @@ class VoiceSessionManager:
                     await session.leave()
                 else:
                     return session
-        session = VoiceSession(channel.guild)
+        session = VoiceSession(
+            channel.guild,
+            context_builder=self._context_builder,
+            user_state=self._user_state,
+        )
         await session.join(channel)
         self._sessions[guild_id] = session
         return session
@@ -1,38 +1,106 @@
 """Meowko Discord Bot - Main entry point."""
 
 import asyncio
+import heapq
 import locale
 import logging
+import logging.handlers
+import os
+import queue
+import threading
 from datetime import datetime
 from pathlib import Path
 from shutil import move
+from typing import Any
 
 from src.config import get_config
 from src.core.scheduler import Scheduler
 from src.discord.client import MeowkoBot
+from src.providers.fish_audio import close_clients
+from src.providers.http import close_session
 
 logger = logging.getLogger("meowko.main")
 
+# Background thread that writes queued log records to the real handlers
+_log_listener: logging.handlers.QueueListener | None = None
+
 
 class SingleLineFormatter(logging.Formatter):
-    """Custom formatter that only outputs the first line of each log message."""
+    """Custom formatter that keeps each log entry, tracebacks included, on one line."""
 
     def format(self, record: logging.LogRecord) -> str:
-        # Keep the main message on one line
-        original_msg = record.msg
-        if isinstance(record.msg, str):
-            record.msg = record.msg.replace("\n", " | ")
+        # Rewrite the formatted string rather than record.msg, so the shared
+        # record is never mutated while other handlers may be formatting it
         formatted = super().format(record)
-        record.msg = original_msg
+        if "\n" in formatted:
+            return formatted.replace("\n", " | ")
         return formatted
 
 
+class _LocalQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler for an in-process listener: enqueue records untouched.
+
+    The stock prepare() pre-formats the message and folds the traceback into
+    it, which is only needed when records cross a process boundary.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+class _BatchedFileHandler(logging.FileHandler):
+    """FileHandler that flushes in batches instead of after every record.
+
+    Buffered records are written out every FLUSH_EVERY records, at most
+    FLUSH_INTERVAL seconds after the first unflushed one, immediately for
+    WARNING and above, and on close (logging.shutdown at exit).
+    """
+
+    FLUSH_EVERY = 50
+    FLUSH_INTERVAL = 1.0
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._unflushed = 0
+        self._flush_timer: threading.Timer | None = None
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if self.stream is None:
+            super().emit(record)
+            return
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+        except RecursionError:  # mirrors logging.StreamHandler.emit
+            raise
+        except Exception:  # noqa: BLE001 - logging must report, not raise, write errors
+            self.handleError(record)
+            return
+        self._unflushed += 1
+        if record.levelno >= logging.WARNING or self._unflushed >= self.FLUSH_EVERY:
+            self.flush()
+        elif self._flush_timer is None:
+            # Bound how long a record can sit in the buffer on a quiet bot
+            self._flush_timer = threading.Timer(self.FLUSH_INTERVAL, self.flush)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+
+    def flush(self) -> None:
+        with self.lock:  # type: ignore[union-attr]
+            super().flush()
+            self._unflushed = 0
+            timer, self._flush_timer = self._flush_timer, None
+        if timer is not None:
+            timer.cancel()
+
+
 def setup_logging(log_file: Path | None = None, log_level: str = "INFO") -> None:
     """Configure logging for the bot.
 
     If a previous log file exists, it will be backed up with a timestamp
-    before starting a new empty log file.
+    before starting a new empty log file. Records are handed to a background
+    thread through a queue, so logging never blocks the event loop on I/O.
     """
+    global _log_listener
     formatter = SingleLineFormatter(
         "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
     )
@@ -52,37 +120,68 @@ def setup_logging(log_file: Path | None = None, log_level: str = "INFO") -> None
 
         # Keep only the 5 most recent log files (backups + new)
         # Reserve 1 slot for the new log file about to be created
-        backups = sorted(log_file.parent.glob(f"{log_file.stem}_*{log_file.suffix}"))
-        for old in backups[: max(0, len(backups) - 4)]:
-            old.unlink()
+        prefix, suffix = f"{log_file.stem}_", log_file.suffix
+        with os.scandir(log_file.parent) as it:
+            backups = [
+                entry for entry in it
+                if entry.name.startswith(prefix)
+                and entry.name.endswith(suffix)
+                and len(entry.name) >= len(prefix) + len(suffix)
+            ]
+        # Backup names embed a sortable timestamp; only the oldest need ordering
+        for old in heapq.nsmallest(max(0, len(backups) - 4), backups, key=lambda e: e.name):
+            os.unlink(old.path)
 
         # Create new empty log file
-        file_handler = logging.FileHandler(log_file, mode="w", encoding="utf-8")
+        file_handler = _BatchedFileHandler(log_file, mode="w", encoding="utf-8")
         file_handler.setFormatter(formatter)
         handlers.append(file_handler)
 
+    stop_logging()
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    _log_listener = logging.handlers.QueueListener(
+        log_queue, *handlers, respect_handler_level=True,
+    )
+    _log_listener.start()
     logging.basicConfig(
         level=getattr(logging, log_level.upper()),
-        handlers=handlers,
+        handlers=[_LocalQueueHandler(log_queue)],
     )
 
     # Silence noisy voice_recv loggers (opus decoder flushes, etc.)
     logging.getLogger("discord.ext.voice_recv").setLevel(logging.ERROR)
 
 
-async def config_watcher(interval: int = 5) -> None:
+def stop_logging() -> None:
+    """Flush queued log records and stop the background log writer."""
+    global _log_listener
+    if _log_listener is not None:
+        _log_listener.stop()
+        for handler in _log_listener.handlers:
+            handler.flush()
+        _log_listener = None
+
+
+async def config_watcher(interval: int = 5, max_interval: int = 60) -> None:
     """Watch for config file changes and reload if modified.
 
+    The poll interval doubles while the file stays unchanged (up to
+    ``max_interval``) and drops back to ``interval`` after a reload.
+
     Args:
-        interval: Seconds between checks.
+        interval: Seconds between checks after startup or a change.
+        max_interval: Upper bound for the backed-off interval.
     """
     config = get_config()
+    delay = interval
     while True:
-        await asyncio.sleep(interval)
+        await asyncio.sleep(delay)
         try:
-            config.reload_if_changed()
+            changed = config.reload_if_changed()
         except Exception:
             logger.exception("Config reload failed")
+            changed = False
+        delay = interval if changed else min(delay * 2, max_interval)
 
 
 async def _main() -> None:
@@ -138,13 +237,26 @@ async def _main() -> None:
             except asyncio.CancelledError:
                 pass
         await bot.close()
+        await close_session()
+        await close_clients()
 
     logger.info("Meowko stopped.")
 
 
 def main() -> None:
-    """Synchronous entry point for console script."""
-    asyncio.run(_main())
+    """Synchronous entry point for console script.
+
+    Runs on uvloop when the optional ``uvloop`` extra is installed.
+    """
+    try:
+        try:
+            import uvloop
+        except ImportError:
+            asyncio.run(_main())
+        else:
+            uvloop.run(_main())
+    finally:
+        stop_logging()
 
 
 if __name__ == "__main__":
@@ -1,10 +1,14 @@
 """Audio processing utilities for voice streaming."""
 
+import functools
 import io
 import math
 import threading
 import wave
-from array import array
+from collections import deque
+from typing import Any
+
+import numpy as np
 
 import discord
 
@@ -20,34 +24,13 @@ class AudioResampler:
         Stereo→mono by averaging channels.
         3840 bytes in → 1920 bytes out.
         """
-        samples = array("h", pcm_48k_stereo)
-        mono = array("h", (
-            (samples[i] + samples[i + 1]) // 2
-            for i in range(0, len(samples), 2)
-        ))
-        return mono.tobytes()
+        return AudioResampler._downmix(pcm_48k_stereo).tobytes()
 
     @staticmethod
-    def resample_mono(pcm: bytes, src_rate: int, dst_rate: int) -> bytes:
-        """Resample mono 16-bit PCM between sample rates via linear interpolation."""
-        if src_rate == dst_rate:
-            return pcm
-        src = array("h", pcm)
-        src_len = len(src)
-        if src_len == 0:
-            return b""
-        ratio = src_rate / dst_rate
-        dst_len = int(src_len / ratio)
-        dst = array("h", [0] * dst_len)
-        for i in range(dst_len):
-            pos = i * ratio
-            idx = int(pos)
-            frac = pos - idx
-            if idx + 1 < src_len:
-                dst[i] = int(src[idx] * (1 - frac) + src[idx + 1] * frac)
-            else:
-                dst[i] = src[min(idx, src_len - 1)]
-        return dst.tobytes()
+    def _downmix(pcm_48k_stereo: bytes) -> np.ndarray[Any, np.dtype[np.int16]]:
+        frames = np.frombuffer(pcm_48k_stereo, dtype=np.int16).reshape(-1, 2)
+        mono = (frames[:, 0].astype(np.int32) + frames[:, 1]) >> 1
+        return mono.astype(np.int16)
 
     @staticmethod
     def tts_to_discord(pcm_48k_mono: bytes) -> bytes:
@@ -57,14 +40,24 @@ class AudioResampler:
         Mono→stereo by duplicating each sample for L+R.
         2x expansion.
         """
-        samples = array("h", pcm_48k_mono)
-        stereo = array("h", (s for sample in samples for s in (sample, sample)))
-        return stereo.tobytes()
+        return AudioResampler._upmix(pcm_48k_mono).tobytes()
+
+    @staticmethod
+    def tts_to_discord_into(pcm_48k_mono: bytes, out: bytearray) -> None:
+        """Like tts_to_discord(), but append the stereo PCM to ``out`` in place."""
+        out += AudioResampler._upmix(pcm_48k_mono).data
+
+    @staticmethod
+    def _upmix(pcm_48k_mono: bytes) -> np.ndarray[Any, np.dtype[np.int16]]:
+        return np.repeat(np.frombuffer(pcm_48k_mono, dtype=np.int16), 2)
 
 
     @staticmethod
     def pcm_to_wav(
-        pcm_data: bytes, sample_rate: int = 48000, channels: int = 1, sample_width: int = 2,
+        pcm_data: bytes | bytearray | memoryview,
+        sample_rate: int = 48000,
+        channels: int = 1,
+        sample_width: int = 2,
     ) -> bytes:
         """Wrap raw PCM bytes in a WAV header."""
         buf = io.BytesIO()
@@ -76,41 +69,141 @@ class AudioResampler:
         return buf.getvalue()
 
 
+class StereoDownmixer:
+    """Stereo→mono downmix that reuses its scratch arrays across frames.
+
+    Same output as AudioResampler.discord_to_stt(), appended in place without
+    allocating temporaries per frame. Not thread-safe; keep one per audio stream.
+    """
+
+    def __init__(self) -> None:
+        self._acc: np.ndarray[Any, np.dtype[np.int32]] = np.empty(0, dtype=np.int32)
+        self._mono: np.ndarray[Any, np.dtype[np.int16]] = np.empty(0, dtype=np.int16)
+
+    def downmix_into(self, pcm_48k_stereo: bytes, out: bytearray) -> None:
+        """Append the mono downmix of ``pcm_48k_stereo`` to ``out``."""
+        frames = np.frombuffer(pcm_48k_stereo, dtype=np.int16).reshape(-1, 2)
+        n = len(frames)
+        if len(self._acc) < n:
+            self._acc = np.empty(n, dtype=np.int32)
+            self._mono = np.empty(n, dtype=np.int16)
+        acc = self._acc[:n]
+        mono = self._mono[:n]
+        np.add(frames[:, 0], frames[:, 1], out=acc, dtype=np.int32)
+        np.right_shift(acc, 1, out=acc)
+        np.copyto(mono, acc, casting="unsafe")
+        out += mono.data
+
+
+class StreamingResampler:
+    """Linear-interpolating mono 16-bit resampler that keeps its phase across chunks.
+
+    Output sample ``k`` is taken at exact rational input position
+    ``k * src_rate / dst_rate``, so chunk boundaries add no clicks or drift.
+    The input needed to interpolate past the end of one chunk is carried over
+    to the next; call flush() once the stream ends.
+    """
+
+    def __init__(self, src_rate: int, dst_rate: int) -> None:
+        g = math.gcd(src_rate, dst_rate)
+        self._up = dst_rate // g
+        self._down = src_rate // g
+        self._emitted = 0  # output samples produced so far
+        self._base = 0  # absolute input index of self._tail[0]
+        self._tail: np.ndarray[Any, np.dtype[np.int16]] = np.empty(0, dtype=np.int16)
+
+    def process(self, pcm: bytes) -> bytes:
+        """Resample the next chunk; returns every output sample it completes."""
+        src = np.concatenate((self._tail, np.frombuffer(pcm, dtype=np.int16)))
+        total = self._base + len(src)
+        # Emit outputs whose right-hand neighbour (index + 1) is already available
+        end = max(((total - 1) * self._up + self._down - 1) // self._down, self._emitted)
+        out = self._interpolate(src, end)
+        # Keep the input from the first sample the next output will need
+        keep_from = end * self._down // self._up
+        self._tail = src[keep_from - self._base:]
+        self._base = keep_from
+        return out
+
+    def flush(self) -> bytes:
+        """Emit the remaining output up to the end of the input seen so far."""
+        total = self._base + len(self._tail)
+        end = max(total * self._up // self._down, self._emitted)
+        out = self._interpolate(self._tail, end)
+        self._tail = np.empty(0, dtype=np.int16)
+        self._base = total
+        return out
+
+    def _interpolate(self, src: np.ndarray[Any, np.dtype[np.int16]], end: int) -> bytes:
+        """Produce outputs [emitted, end) from ``src`` (starting at self._base)."""
+        if end <= self._emitted or not len(src):
+            return b""
+        pos = np.arange(self._emitted, end, dtype=np.int64) * self._down
+        idx = pos // self._up - self._base
+        frac = (pos % self._up) / self._up
+        left = src[idx].astype(np.float64)
+        # Past the last sample, hold it (only reachable from flush())
+        right = src[np.minimum(idx + 1, len(src) - 1)]
+        self._emitted = end
+        return (left + (right - left) * frac).astype(np.int16).tobytes()
+
+
+def is_silent(pcm: bytes) -> bool:
+    """Return True if a PCM buffer is pure digital silence (all zero bytes)."""
+    return not np.frombuffer(pcm, dtype=np.uint8).any()
+
+
+@functools.lru_cache(maxsize=16)
 def generate_ding(
     frequency: float = 880.0,
     duration_ms: int = 150,
     sample_rate: int = 48000,
     volume: float = 0.3,
 ) -> bytes:
-    """Generate a short sine-wave ding as 48kHz stereo 16-bit PCM."""
+    """Generate a short sine-wave ding as 48kHz stereo 16-bit PCM (memoized)."""
     num_samples = int(sample_rate * duration_ms / 1000)
     fade_samples = min(num_samples // 3, int(sample_rate * 0.03))
     fade_in_samples = max(fade_samples // 3, 1)
 
-    mono = array("h", [0] * num_samples)
-    for i in range(num_samples):
-        t = i / sample_rate
-        value = math.sin(2 * math.pi * frequency * t) * volume
-        if i < fade_in_samples:
-            value *= i / fade_in_samples
-        elif i >= num_samples - fade_samples:
-            value *= (num_samples - i) / fade_samples
-        mono[i] = int(value * 32767)
+    i = np.arange(num_samples)
+    envelope = np.ones(num_samples)
+    envelope[:fade_in_samples] = i[:fade_in_samples] / fade_in_samples
+    if fade_samples:
+        tail = i[num_samples - fade_samples:]
+        envelope[num_samples - fade_samples:] = (num_samples - tail) / fade_samples
+    tone = np.sin(2 * math.pi * frequency * (i / sample_rate)) * volume
+    mono = (tone * envelope * 32767).astype(np.int16)
+    return np.repeat(mono, 2).tobytes()
+
+
+def _fade_ramp(n: int) -> np.ndarray[Any, np.dtype[np.float64]]:
+    """Linear 1 → 0 gain per interleaved sample: 1 - i/n."""
+    return 1.0 - np.arange(n) / n
 
-    stereo = array("h", (s for sample in mono for s in (sample, sample)))
-    return stereo.tobytes()
+
+# ~5ms at 48kHz stereo 16-bit: 240 stereo frames × 4 bytes/frame = 960 bytes
+_FADE_BYTES = 960
+
+# Gain ramp for a full-length fade-out (one gain per int16 sample)
+_FADE_RAMP = _fade_ramp(_FADE_BYTES // 2)
 
 
 class PCMStreamSource(discord.AudioSource):
     """Thread-safe buffered PCM audio source for discord.py voice playback.
 
     Feed PCM data from async TTS callbacks, read by discord.py's voice thread.
+    Fed audio is cut into ready-to-send frames as it arrives, so read() is a
+    constant-time pop however much audio is queued. The frame deque is the
+    only state shared with the reader (deque append/popleft are atomic), so
+    read() never takes the lock; the lock only orders the writer-side calls.
     """
 
     FRAME_SIZE = 3840  # 20ms at 48kHz stereo 16-bit: 48000 * 2 * 2 * 0.02
+    _SILENCE_FRAME = bytes(FRAME_SIZE)  # immutable, so safe to hand out repeatedly
 
     def __init__(self) -> None:
-        self._buffer = bytearray()
+        self._frames: deque[bytes] = deque()
+        self._residual = bytearray()  # fed bytes not yet making up a full frame
         self._lock = threading.Lock()
         self._finished = False
         self._interrupted = False
@@ -119,38 +212,76 @@ class PCMStreamSource(discord.AudioSource):
         """Append PCM data to the buffer. Called from async TTS callback."""
         with self._lock:
             if not self._interrupted:
-                self._buffer.extend(pcm_data)
+                self._residual.extend(pcm_data)
+                self._split_frames()
+
+    def feed_mono(self, pcm_48k_mono: bytes) -> None:
+        """Upmix 48kHz mono PCM straight into the buffer (no intermediate bytes)."""
+        with self._lock:
+            if not self._interrupted:
+                AudioResampler.tts_to_discord_into(pcm_48k_mono, self._residual)
+                self._split_frames()
+
+    def _split_frames(self) -> None:
+        """Move every complete frame from the residual buffer onto the frame queue."""
+        buf = self._residual
+        size = self.FRAME_SIZE
+        end = len(buf) - len(buf) % size
+        if not end:
+            return
+        with memoryview(buf) as view:
+            self._frames.extend(bytes(view[i:i + size]) for i in range(0, end, size))
+        del buf[:end]
 
     def finish(self) -> None:
-        """Signal that no more data will be fed."""
+        """Signal that no more data will be fed.
+
+        The tail is faded out and padded with silence into a final full frame.
+        """
         with self._lock:
-            self._apply_fade_out()
+            if self._finished:
+                return
+            tail = self._residual
+            # The fade may reach back into the last queued frame. pop() is atomic
+            # against the reader's popleft(); if the reader won, that frame has
+            # already been played and only the residual is faded.
+            if len(tail) < _FADE_BYTES:
+                try:
+                    tail[:0] = self._frames.pop()
+                except IndexError:
+                    pass
+            self._apply_fade_out(tail)
+            if len(tail) % self.FRAME_SIZE:
+                tail.extend(bytes(self.FRAME_SIZE - len(tail) % self.FRAME_SIZE))
+            self._split_frames()
+            # Set only after the final frames are queued; read() relies on it
             self._finished = True
 
-    def _apply_fade_out(self) -> None:
+    @staticmethod
+    def _apply_fade_out(buf: bytearray) -> None:
         """Apply a short fade-out to the buffer tail to prevent end-of-stream clicks."""
-        # ~5ms at 48kHz stereo 16-bit: 240 stereo frames × 4 bytes/frame = 960 bytes
-        FADE_BYTES = 960
-        buf_len = len(self._buffer)
+        buf_len = len(buf)
         if buf_len < 4:
             return
-        fade_len = min(buf_len, FADE_BYTES)
+        fade_len = min(buf_len, _FADE_BYTES)
         fade_len -= fade_len % 4  # align to stereo sample boundary
         if fade_len < 4:
             return
 
         start = buf_len - fade_len
-        samples = array("h", bytes(self._buffer[start:]))
-        n = len(samples)
-        for i in range(n):
-            samples[i] = int(samples[i] * (1.0 - i / n))
-        self._buffer[start:] = samples.tobytes()
+        n = fade_len // 2
+        ramp = _FADE_RAMP if n == len(_FADE_RAMP) else _fade_ramp(n)
+        # Writable view into the buffer; released before the buffer can resize
+        samples = np.frombuffer(buf, dtype=np.int16, offset=start)
+        samples[:] = (samples * ramp).astype(np.int16)
+        del samples
 
     def interrupt(self) -> None:
         """Immediately stop playback (barge-in)."""
         with self._lock:
             self._interrupted = True
-            self._buffer.clear()
+            self._frames.clear()
+            self._residual.clear()
 
     def read(self) -> bytes:
         """Read one frame (3840 bytes) for discord.py voice thread.
@@ -158,22 +289,23 @@ class PCMStreamSource(discord.AudioSource):
         Returns silence on buffer underrun, empty bytes when finished/interrupted.
         Called every 20ms by the voice send thread.
         """
-        with self._lock:
-            if self._interrupted:
-                return b""
-            if len(self._buffer) >= self.FRAME_SIZE:
-                frame = bytes(self._buffer[:self.FRAME_SIZE])
-                del self._buffer[:self.FRAME_SIZE]
-                return frame
-            if self._finished:
-                if self._buffer:
-                    # Pad remaining data with silence
-                    frame = bytes(self._buffer) + b"\x00" * (self.FRAME_SIZE - len(self._buffer))
-                    self._buffer.clear()
-                    return frame
+        if self._interrupted:
+            return b""
+        # No lock: popleft() is atomic, but interrupt()/finish() may empty the
+        # deque at any point, so never check-then-pop.
+        frames = self._frames
+        try:
+            return frames.popleft()
+        except IndexError:
+            pass
+        if self._finished:
+            # finish() may have queued its last frames since the attempt above
+            try:
+                return frames.popleft()
+            except IndexError:
                 return b""
-            # Buffer underrun — return silence to avoid gaps
-            return b"\x00" * self.FRAME_SIZE
+        # Buffer underrun — return silence to avoid gaps
+        return self._SILENCE_FRAME
 
     def is_opus(self) -> bool:
         """We provide raw PCM, not Opus."""
@@ -181,4 +313,5 @@ class PCMStreamSource(discord.AudioSource):
 
     def cleanup(self) -> None:
         with self._lock:
-            self._buffer.clear()
+            self._frames.clear()
+            self._residual.clear()
@@ -2,6 +2,7 @@
 
 import asyncio
 import contextlib
+import functools
 import logging
 from collections.abc import AsyncIterable, Callable, Coroutine
 from typing import Any
@@ -16,7 +17,7 @@ from httpx_ws import aconnect_ws  # type: ignore[import-untyped]
 from wsproto.utilities import LocalProtocolError
 
 from src.config import get_config
-from src.media.audio import AudioResampler
+from src.media.audio import StreamingResampler
 
 logger = logging.getLogger("meowko.providers.fish_audio")
 
@@ -25,7 +26,12 @@ AsyncAudioCallback = Callable[[bytes], Coroutine[Any, Any, None]]
 
 
 def _load_config() -> dict[str, Any]:
-    """Load the fish_audio config section."""
+    """Load the fish_audio config section (cached until the config is reloaded)."""
+    return _load_config_for(get_config().generation)
+
+
+@functools.lru_cache(maxsize=1)
+def _load_config_for(generation: int) -> dict[str, Any]:
     cfg = get_config().fish_audio
     return {
         "api_key": cfg["api_key"],
@@ -36,16 +42,34 @@ def _load_config() -> dict[str, Any]:
     }
 
 
+# Fish Audio SDK clients by API key, shared by every TTS instance so the
+# underlying HTTP connection pool is reused across sessions
+_clients: dict[str, AsyncFishAudio] = {}
+
+
+def _get_client(api_key: str) -> AsyncFishAudio:
+    """Return the shared Fish Audio client for an API key."""
+    client = _clients.get(api_key)
+    if client is None:
+        client = _clients[api_key] = AsyncFishAudio(api_key=api_key)
+    return client
+
+
+async def close_clients() -> None:
+    """Close all shared Fish Audio clients (call once on shutdown)."""
+    clients = list(_clients.values())
+    _clients.clear()
+    for client in clients:
+        if hasattr(client, "close"):
+            await client.close()
+
+
 class FishAudioTTS:
     """Batch text-to-speech via Fish Audio SDK."""
 
     def __init__(self) -> None:
         self._cfg = _load_config()
-        self._client = AsyncFishAudio(api_key=self._cfg["api_key"])
-
-    async def close(self) -> None:
-        if hasattr(self._client, "close"):
-            await self._client.close()
+        self._client = _get_client(self._cfg["api_key"])
 
     async def synthesize(
         self,
@@ -85,11 +109,8 @@ class FishAudioStreamingTTS:
     def __init__(self, on_audio: AsyncAudioCallback | None = None) -> None:
         self._cfg = _load_config()
         self.on_audio = on_audio
-        self._client = AsyncFishAudio(api_key=self._cfg["api_key"])
-
-    async def close(self) -> None:
-        if hasattr(self._client, "close"):
-            await self._client.close()
+        self._client = _get_client(self._cfg["api_key"])
+        self._ws_headers: dict[str, str] | None = None
 
     async def synthesize_streaming(
         self,
@@ -98,8 +119,9 @@ class FishAudioStreamingTTS:
     ) -> None:
         """Stream TTS from an async token stream. Calls on_audio with 48kHz PCM chunks.
 
-        Fish Audio outputs 44.1kHz PCM; each chunk is resampled to 48kHz
-        before invoking the callback so the voice pipeline stays at 48kHz.
+        Fish Audio outputs 44.1kHz PCM; chunks are resampled to 48kHz by one
+        stateful resampler (continuous across chunk boundaries) before invoking
+        the callback so the voice pipeline stays at 48kHz.
         """
         cfg = self._cfg
         voice = voice_id or cfg["default_voice_id"]
@@ -109,31 +131,43 @@ class FishAudioStreamingTTS:
 
         total_bytes = 0
         leftover = b""
+        resampler = StreamingResampler(44100, 48000)
+        on_audio = self.on_audio
 
-        async for chunk in self._stream_websocket_safe(
+        audio_stream = self._stream_websocket_safe(
             text_stream=text_stream,
             reference_id=voice or None,
             format="pcm",
             latency=cfg["latency"],
             speed=speed if speed != 1.0 else None,
             config=TTSConfig(sample_rate=44100),
-        ):
-            if not chunk or not self.on_audio:
+        )
+        if on_audio is None:
+            # Nobody to deliver to; still drive the stream to completion
+            async for _ in audio_stream:
+                pass
+            logger.info("Streaming TTS completed without an audio callback")
+            return
+
+        async for chunk in audio_stream:
+            if not chunk:
                 continue
-            chunk = leftover + chunk
-            if len(chunk) % 2:
-                leftover = chunk[-1:]
-                chunk = chunk[:-1]
-            else:
-                leftover = b""
-            if chunk:
-                resampled = AudioResampler.resample_mono(chunk, 44100, 48000)
-                await self.on_audio(resampled)
+            # Keep 16-bit sample alignment; chunks are normally even-sized and
+            # then pass straight through without any concatenation
+            if leftover or len(chunk) % 2:
+                chunk = leftover + chunk
+                split = len(chunk) & ~1
+                chunk, leftover = chunk[:split], chunk[split:]
+            resampled = resampler.process(chunk)
+            if resampled:
+                await on_audio(resampled)
                 total_bytes += len(resampled)
 
-        if leftover and self.on_audio:
-            resampled = AudioResampler.resample_mono(leftover + b"\x00", 44100, 48000)
-            await self.on_audio(resampled)
+        # A dangling odd byte is padded into one final sample
+        resampled = resampler.process(leftover + b"\x00") if leftover else b""
+        resampled += resampler.flush()
+        if resampled:
+            await on_audio(resampled)
             total_bytes += len(resampled)
 
         logger.info("Streaming TTS completed: %d bytes (48kHz)", total_bytes)
@@ -156,12 +190,14 @@ class FishAudioStreamingTTS:
             tts_request.prosody = Prosody.from_speed_override(speed, base=config.prosody)
 
         tts_client = self._client.tts._client
-        ws_headers = tts_client.get_headers({"model": "s1"})
+        # Static for the client's lifetime; built once instead of per utterance
+        if self._ws_headers is None:
+            self._ws_headers = tts_client.get_headers({"model": "s1"})
 
         async with aconnect_ws(
             "/v1/tts/live",
             client=tts_client.client,
-            headers=ws_headers,
+            headers=self._ws_headers,
         ) as ws:
             async def sender() -> None:
                 await ws.send_bytes(ormsgpack.packb(StartEvent(request=tts_request).model_dump()))
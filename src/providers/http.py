@@ -0,0 +1,49 @@
+"""Shared HTTP client sessions for provider REST calls."""
+
+import aiohttp
+import httpx
+import openai
+
+_session: aiohttp.ClientSession | None = None
+_openai_http_client: httpx.AsyncClient | None = None
+
+
+async def get_session() -> aiohttp.ClientSession:
+    """Return the process-wide aiohttp session, creating it on first use.
+
+    One pooled session keeps TCP/TLS connections and DNS lookups warm across
+    requests; pass per-request timeouts on each call instead of on the session.
+    """
+    global _session
+    if _session is None or _session.closed:
+        connector = aiohttp.TCPConnector(
+            limit=100, limit_per_host=32, ttl_dns_cache=300, keepalive_timeout=75,
+        )
+        _session = aiohttp.ClientSession(connector=connector)
+    return _session
+
+
+def get_openai_http_client() -> httpx.AsyncClient:
+    """Return the httpx client shared by every ``openai.AsyncOpenAI`` instance.
+
+    Timeouts stay on each ``AsyncOpenAI`` client, which applies them per request.
+    """
+    global _openai_http_client
+    if _openai_http_client is None or _openai_http_client.is_closed:
+        _openai_http_client = openai.DefaultAsyncHttpxClient(
+            limits=httpx.Limits(
+                max_connections=200, max_keepalive_connections=50, keepalive_expiry=30,
+            ),
+        )
+    return _openai_http_client
+
+
+async def close_session() -> None:
+    """Close the shared sessions (call once on shutdown)."""
+    global _session, _openai_http_client
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
+    if _openai_http_client is not None and not _openai_http_client.is_closed:
+        await _openai_http_client.aclose()
+    _openai_http_client = None
@@ -1,6 +1,7 @@
 """OpenAI-compatible text-to-image client."""
 
 import base64
+import functools
 import logging
 import re
 from typing import Any
@@ -8,9 +9,14 @@ from typing import Any
 import openai
 
 from src.config import get_config
+from src.providers.http import get_openai_http_client
 
 logger = logging.getLogger("meowko.providers.image_gen")
 
+_B64_MARKER = "base64,"
+_B64_RE = re.compile(r"[A-Za-z0-9+/=\n\r]+")
+_IMAGE_BLOCK_TYPES = frozenset({"image_url", "image"})
+
 
 class ImageGenClient:
     """Generates images from text prompts via an OpenAI-compatible API.
@@ -36,6 +42,7 @@ class ImageGenClient:
             base_url=resolved["base_url"],
             api_key=resolved["api_key"],
             timeout=tti["timeout"],
+            http_client=get_openai_http_client(),
         )
         self.model = resolved["model"]
         self.size = tti["size"]
@@ -86,10 +93,9 @@ class ImageGenClient:
             messages=[{"role": "user", "content": prompt}],
         )
 
-        message = response.choices[0].message
-        raw: dict[str, Any] = message.model_dump()
-        content = raw.get("content")
-
+        # Non-standard providers return a list of blocks here; the SDK keeps
+        # them as raw dicts, so read the field instead of dumping the model.
+        content: Any = response.choices[0].message.content
         image_bytes = self._extract_image(content)
         if not image_bytes:
             raise RuntimeError(
@@ -112,18 +118,9 @@ class ImageGenClient:
         """
         if isinstance(content, list):
             for block in content:
-                if not isinstance(block, dict):
-                    continue
-                # {"type": "image_url", "image_url": {"url": "data:...;base64,..."}}
-                if block.get("type") == "image_url":
-                    url = block.get("image_url", {}).get("url", "")
-                    b = _decode_data_url(url)
-                    if b:
-                        return b
-                # {"type": "image", "image_url": {"url": "data:..."}}  (variant)
-                if block.get("type") == "image":
-                    url = block.get("image_url", {}).get("url", "")
-                    b = _decode_data_url(url)
+                # {"type": "image_url" | "image", "image_url": {"url": "data:...;base64,..."}}
+                if isinstance(block, dict) and block.get("type") in _IMAGE_BLOCK_TYPES:
+                    b = _decode_data_url(block.get("image_url", {}).get("url", ""))
                     if b:
                         return b
 
@@ -135,14 +132,26 @@ class ImageGenClient:
         return None
 
 
+def get_image_gen_client() -> ImageGenClient:
+    """Return the shared TTI client (rebuilt when the config is reloaded).
+
+    Raises:
+        ValueError: If ``tti.model`` is not configured.
+    """
+    return _image_gen_client_for(get_config().generation)
+
+
+@functools.lru_cache(maxsize=1)
+def _image_gen_client_for(generation: int) -> ImageGenClient:
+    return ImageGenClient()
+
+
 def _decode_data_url(text: str) -> bytes | None:
     """Decode the first ``data:image/...;base64,...`` in *text*."""
-    marker = "base64,"
-    idx = text.find(marker)
+    idx = text.find(_B64_MARKER)
     if idx == -1:
         return None
-    b64_start = text[idx + len(marker):]
-    m = re.match(r"[A-Za-z0-9+/=\n\r]+", b64_start)
+    m = _B64_RE.match(text, idx + len(_B64_MARKER))
     if not m:
         return None
     return base64.b64decode(m.group())
@@ -1,17 +1,55 @@
 """OpenAI-compatible LLM client."""
 
-import json
+import asyncio
+import functools
+import hashlib
 import logging
+import threading
+from collections import deque
 from datetime import datetime
+from pathlib import Path
 from typing import Any
 
 import openai
+import orjson
 
 from src.config import get_config
+from src.providers.http import get_openai_http_client
 
 logger = logging.getLogger("meowko.providers.llm")
 
 
+def _scrub_images(messages: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Replace inline base64 image URLs with a short size/hash placeholder.
+
+    Plain-text messages and non-image blocks are shared, not copied.
+    """
+    scrubbed = []
+    for msg in messages:
+        content = msg.get("content")
+        if isinstance(content, list):
+            blocks = []
+            for block in content:
+                url = block.get("image_url", {}).get("url", "") if isinstance(block, dict) else ""
+                if url.startswith("data:"):
+                    header, _, data = url.partition(",")
+                    digest = hashlib.sha256(data.encode(), usedforsecurity=False).hexdigest()
+                    url = f"{header},<{len(data)} chars, sha256={digest[:12]}>"
+                    block = {**block, "image_url": {**block["image_url"], "url": url}}
+                blocks.append(block)
+            msg = {**msg, "content": blocks}
+        scrubbed.append(msg)
+    return scrubbed
+
+
+def _compute_cost(
+    prompt: int, cached: int, completion: int,
+    input_price: float, cached_price: float, output_price: float,
+) -> float:
+    """Price a completion from token counts and per-token prices."""
+    return (prompt - cached) * input_price + cached * cached_price + completion * output_price
+
+
 class LLMResponse:
     """Response from LLM including text, token usage, and cost."""
 
@@ -46,26 +84,19 @@ class LLMStream:
         parts: list[str] = []
         usage = None
         async for chunk in stream:
-            if chunk.usage:
+            # Keep the last non-null usage; not every backend sends it on the final chunk
+            if chunk.usage is not None:
                 usage = chunk.usage
-            if chunk.choices and chunk.choices[0].delta.content:
-                token = chunk.choices[0].delta.content
-                parts.append(token)
-                yield token
+            choices = chunk.choices
+            if choices:
+                token = choices[0].delta.content
+                if token:
+                    parts.append(token)
+                    yield token
 
         content = "".join(parts)
-        prompt_tokens = usage.prompt_tokens if usage else 0
-        completion_tokens = usage.completion_tokens if usage else 0
-        total_tokens = usage.total_tokens if usage else 0
-        cached_tokens = 0
-        if usage and hasattr(usage, "prompt_tokens_details") and usage.prompt_tokens_details:
-            cached_tokens = getattr(usage.prompt_tokens_details, "cached_tokens", 0) or 0
-
-        non_cached = prompt_tokens - cached_tokens
-        cost = (
-            (cached_tokens / 1_000_000) * client.cached_price
-            + (non_cached / 1_000_000) * client.input_price
-            + (completion_tokens / 1_000_000) * client.output_price
+        prompt_tokens, completion_tokens, total_tokens, cached_tokens, cost = (
+            client._compute_usage_and_cost(usage)
         )
 
         self.response = LLMResponse(
@@ -92,6 +123,7 @@ class LLMClient:
             base_url=model_config["base_url"],
             api_key=model_config["api_key"],
             timeout=model_config["timeout"],
+            http_client=get_openai_http_client(),
         )
         self.model = model_config["model"]
         self.max_tokens = model_config["max_tokens"]
@@ -100,12 +132,22 @@ class LLMClient:
         self._request_dir = (
             config.data_dir / config.paths["cache_dir"] / self._REQUEST_DIR_NAME
         )
+        # Saved request files, oldest first; seeded once so pruning never globs
+        self._recent_requests: deque[Path] = deque(sorted(self._request_dir.glob("*.json")))
+        self._save_lock = threading.Lock()
+        self._save_tasks: set[asyncio.Task[None]] = set()
 
         # Load pricing (per 1M tokens)
         pricing = model_config["pricing"]
         self.input_price = pricing["input"]
         self.cached_price = pricing["cached"]
         self.output_price = pricing["output"]
+        # Per-token (input, cached, output) prices
+        self._prices = (
+            self.input_price / 1_000_000,
+            self.cached_price / 1_000_000,
+            self.output_price / 1_000_000,
+        )
 
     async def chat(
         self,
@@ -123,7 +165,7 @@ class LLMClient:
         Returns:
             LLMResponse with content and token usage.
         """
-        self._save_request(messages, temperature)
+        self._spawn_save_request(messages, temperature)
 
         response = await self.client.chat.completions.create(
             model=self.model,
@@ -133,23 +175,9 @@ class LLMClient:
         )
 
         content = response.choices[0].message.content or ""
-        usage = response.usage
-
-        prompt_tokens = usage.prompt_tokens if usage else 0
-        completion_tokens = usage.completion_tokens if usage else 0
-        total_tokens = usage.total_tokens if usage else 0
-
-        # Check for cached tokens (OpenAI API v2+ provides this)
-        cached_tokens = 0
-        if usage and hasattr(usage, 'prompt_tokens_details') and usage.prompt_tokens_details:
-            cached_tokens = getattr(usage.prompt_tokens_details, 'cached_tokens', 0) or 0
-
-        # Calculate cost (prices are per 1M tokens)
-        non_cached_input = prompt_tokens - cached_tokens
-        cached_input_cost = (cached_tokens / 1_000_000) * self.cached_price
-        non_cached_input_cost = (non_cached_input / 1_000_000) * self.input_price
-        output_cost = (completion_tokens / 1_000_000) * self.output_price
-        total_cost = cached_input_cost + non_cached_input_cost + output_cost
+        prompt_tokens, completion_tokens, total_tokens, cached_tokens, total_cost = (
+            self._compute_usage_and_cost(response.usage)
+        )
 
         return LLMResponse(
             content=content,
@@ -160,6 +188,24 @@ class LLMClient:
             cost=total_cost,
         )
 
+    def _compute_usage_and_cost(self, usage: Any) -> tuple[int, int, int, int, float]:
+        """Extract token counts from an API usage object and price them.
+
+        Returns:
+            (prompt_tokens, completion_tokens, total_tokens, cached_tokens, cost)
+        """
+        if not usage:
+            return 0, 0, 0, 0, 0.0
+        prompt_tokens = usage.prompt_tokens
+        completion_tokens = usage.completion_tokens
+        # Cached tokens are only reported by some providers (OpenAI API v2+)
+        try:
+            cached_tokens = usage.prompt_tokens_details.cached_tokens or 0
+        except AttributeError:
+            cached_tokens = 0
+        cost = _compute_cost(prompt_tokens, cached_tokens, completion_tokens, *self._prices)
+        return prompt_tokens, completion_tokens, usage.total_tokens, cached_tokens, cost
+
     async def chat_stream(
         self,
         messages: list[dict[str, Any]],
@@ -170,7 +216,7 @@ class LLMClient:
         Returns an LLMStream that yields tokens as they arrive.
         After iteration completes, access .response for usage stats.
         """
-        self._save_request(messages, temperature)
+        self._spawn_save_request(messages, temperature)
 
         stream = await self.client.chat.completions.create(  # type: ignore[call-overload]
             model=self.model,
@@ -183,36 +229,55 @@ class LLMClient:
 
         return LLMStream(stream, self)
 
+    def _spawn_save_request(
+        self,
+        messages: list[dict[str, Any]],
+        temperature: float,
+    ) -> None:
+        """Save the request on a worker thread so the API call is not delayed."""
+        # Snapshot the list; the caller is free to extend it once the call returns
+        task = asyncio.create_task(
+            asyncio.to_thread(self._save_request, list(messages), temperature)
+        )
+        self._save_tasks.add(task)
+        task.add_done_callback(self._save_tasks.discard)
+
     def _save_request(
         self,
         messages: list[dict[str, Any]],
         temperature: float,
     ) -> None:
         """Save the LLM request to cache, keeping only the 5 most recent."""
-        try:
-            self._request_dir.mkdir(parents=True, exist_ok=True)
-
-            timestamp = datetime.now().strftime("%Y%m%d-%H%M%S-%f")
-            path = self._request_dir / f"{timestamp}.json"
-            payload = {
-                "timestamp": datetime.now().isoformat(),
-                "model": self.model,
-                "temperature": temperature,
-                "max_tokens": self.max_tokens,
-                "messages": messages,
-            }
-            path.write_text(json.dumps(payload, ensure_ascii=False, indent=2))
-
-            # Remove oldest files beyond the limit
-            files = sorted(self._request_dir.glob("*.json"))
-            to_delete = files[: max(0, len(files) - self._MAX_SAVED_REQUESTS)]
-            if to_delete:
-                logger.debug(
-                    "LLM request cache: %d files, deleting %d, keeping %d",
-                    len(files), len(to_delete), len(files) - len(to_delete),
-                )
-            for old in to_delete:
-                logger.debug("Deleting old request: %s", old.name)
-                old.unlink()
-        except Exception:
-            logger.debug("Failed to save LLM request", exc_info=True)
\ No newline at end of file
+        with self._save_lock:
+            try:
+                self._request_dir.mkdir(parents=True, exist_ok=True)
+
+                now = datetime.now()
+                path = self._request_dir / f"{now:%Y%m%d-%H%M%S-%f}.json"
+                payload = {
+                    "timestamp": now.isoformat(),
+                    "model": self.model,
+                    "temperature": temperature,
+                    "max_tokens": self.max_tokens,
+                    "messages": _scrub_images(messages),
+                }
+                path.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+
+                # Remove oldest files beyond the limit
+                self._recent_requests.append(path)
+                while len(self._recent_requests) > self._MAX_SAVED_REQUESTS:
+                    old = self._recent_requests.popleft()
+                    logger.debug("Deleting old request: %s", old.name)
+                    old.unlink(missing_ok=True)
+            except Exception:
+                logger.debug("Failed to save LLM request", exc_info=True)
+
+
+def get_llm_client() -> LLMClient:
+    """Return the shared LLM client (rebuilt when the config is reloaded)."""
+    return _llm_client_for(get_config().generation)
+
+
+@functools.lru_cache(maxsize=1)
+def _llm_client_for(generation: int) -> LLMClient:
+    return LLMClient()
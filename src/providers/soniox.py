@@ -1,26 +1,44 @@
 """Soniox STT providers — batch (REST) and streaming (WebSocket)."""
 
 import asyncio
-import json
+import functools
 import logging
+import math
+import time
+from collections import deque
 from collections.abc import Callable, Coroutine
 from typing import Any
 
 import aiohttp
+import orjson
 import websockets
 
 from src.config import get_config
+from src.providers.http import get_session
 
 logger = logging.getLogger("meowko.providers.soniox")
 
 BASE_URL = "https://api.soniox.com/v1"
 STREAMING_URL = "wss://stt-rt.soniox.com/transcribe-websocket"
 
+# Minimum seconds between "sent N audio chunks" progress logs per stream
+_SEND_LOG_INTERVAL = 5.0
+
+# Transcript polling schedule: start fast so short clips are picked up early
+_POLL_INITIAL_DELAY = 0.1
+_POLL_BACKOFF = 1.3
+_POLL_MAX_DELAY = 2.0
+
 AsyncTextCallback = Callable[[str], Coroutine[Any, Any, None]]
 
 
 def _load_config() -> dict[str, Any]:
-    """Load the soniox config section."""
+    """Load the soniox config section (cached until the config is reloaded)."""
+    return _load_config_for(get_config().generation)
+
+
+@functools.lru_cache(maxsize=1)
+def _load_config_for(generation: int) -> dict[str, Any]:
     cfg = get_config().soniox
     return {
         "api_key": cfg["api_key"],
@@ -31,6 +49,22 @@ def _load_config() -> dict[str, Any]:
     }
 
 
+def _parse_retry_after(value: str | None, limit: float) -> float | None:
+    """Parse a Retry-After header given in seconds, capped at ``limit``.
+
+    Returns None for missing, malformed or non-finite values.
+    """
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        return None
+    if not math.isfinite(seconds):
+        return None
+    return min(max(seconds, 0.0), float(limit))
+
+
 class SonioxSTT:
     """Batch speech-to-text via Soniox async REST API."""
 
@@ -40,81 +74,79 @@ class SonioxSTT:
         self._model = cfg["model"]
         self._language_hints = cfg["language_hints"]
         self._timeout = cfg["timeout"]
-        self._session: aiohttp.ClientSession | None = None
-
-    async def _get_session(self) -> aiohttp.ClientSession:
-        if self._session is None or self._session.closed:
-            timeout = aiohttp.ClientTimeout(total=self._timeout)
-            self._session = aiohttp.ClientSession(timeout=timeout)
-        return self._session
-
-    async def close(self) -> None:
-        if self._session and not self._session.closed:
-            await self._session.close()
-            self._session = None
+        self._request_timeout = aiohttp.ClientTimeout(total=self._timeout)
+        self._headers = {
+            "Authorization": f"Bearer {self._api_key}",
+            "Content-Type": "application/json",
+        }
+        self._base_payload: dict[str, Any] = {"model": self._model}
+        if self._language_hints:
+            self._base_payload["language_hints"] = self._language_hints
+        # Finished transcriptions awaiting cleanup, drained by one worker task
+        self._pending_deletes: deque[str] = deque()
+        self._delete_worker: asyncio.Task[None] | None = None
 
     async def transcribe(self, audio_url: str) -> str:
         """Transcribe audio from a URL via Soniox async API.
 
         Flow: POST create → poll GET transcript → DELETE cleanup.
         """
-        headers = {
-            "Authorization": f"Bearer {self._api_key}",
-            "Content-Type": "application/json",
-        }
-        payload: dict[str, Any] = {
-            "model": self._model,
-            "audio_url": audio_url,
-        }
-        if self._language_hints:
-            payload["language_hints"] = self._language_hints
-
-        session = await self._get_session()
+        payload = {**self._base_payload, "audio_url": audio_url}
+        session = await get_session()
 
         # 1. Create transcription
         async with session.post(
-            f"{BASE_URL}/transcriptions", headers=headers, json=payload,
+            f"{BASE_URL}/transcriptions", headers=self._headers, json=payload,
+            timeout=self._request_timeout,
         ) as resp:
             if resp.status not in (200, 201):
                 body = await resp.text()
                 raise RuntimeError(
                     f"Soniox STT create failed ({resp.status}): {body[:200]}"
                 )
-            data = await resp.json()
+            data = await resp.json(loads=orjson.loads)
 
         transcription_id = data["id"]
         logger.info("Soniox STT created transcription %s", transcription_id)
 
         # 2. Poll for transcript
         poll_url = f"{BASE_URL}/transcriptions/{transcription_id}/transcript"
-        text = await self._poll_transcript(session, headers, poll_url)
+        text = await self._poll_transcript(session, poll_url)
 
-        # 3. Delete transcription (fire-and-forget)
-        asyncio.create_task(self._delete(session, headers, transcription_id))
+        # 3. Delete transcription (in the background)
+        self._pending_deletes.append(transcription_id)
+        if self._delete_worker is None or self._delete_worker.done():
+            self._delete_worker = asyncio.create_task(self._drain_deletes(session))
 
         return text
 
     async def _poll_transcript(
         self,
         session: aiohttp.ClientSession,
-        headers: dict[str, str],
         url: str,
     ) -> str:
         """Poll until transcript is ready, with exponential backoff."""
-        delay = 0.5
+        delay = _POLL_INITIAL_DELAY
         elapsed = 0.0
         while elapsed < self._timeout:
-            async with session.get(url, headers=headers) as resp:
+            async with session.get(
+                url, headers=self._headers, timeout=self._request_timeout,
+            ) as resp:
                 if resp.status == 200:
-                    data = await resp.json()
+                    data = await resp.json(loads=orjson.loads)
                     text = str(data.get("text", "")).strip()
                     logger.info("Soniox STT transcribed: %s", text[:80])
                     return text
                 if resp.status == 409:
                     # Transcription not yet complete
-                    await asyncio.sleep(delay)
-                    elapsed += delay
-                    delay = min(delay * 1.5, 5.0)
+                    # Honour the server's hint up to the remaining timeout budget
+                    retry_after = _parse_retry_after(
+                        resp.headers.get("Retry-After"), self._timeout - elapsed,
+                    )
+                    sleep_for = delay if retry_after is None else retry_after
+                    await asyncio.sleep(sleep_for)
+                    elapsed += sleep_for
+                    delay = min(delay * _POLL_BACKOFF, _POLL_MAX_DELAY)
                     continue
                 body = await resp.text()
                 raise RuntimeError(
@@ -124,17 +156,24 @@ class SonioxSTT:
             f"Soniox STT transcription timed out after {self._timeout}s"
         )
 
+    async def _drain_deletes(self, session: aiohttp.ClientSession) -> None:
+        """Delete queued transcriptions, batching any that pile up meanwhile."""
+        while self._pending_deletes:
+            ids = list(self._pending_deletes)
+            self._pending_deletes.clear()
+            await asyncio.gather(*(self._delete(session, tid) for tid in ids))
+
     async def _delete(
         self,
         session: aiohttp.ClientSession,
-        headers: dict[str, str],
         transcription_id: str,
     ) -> None:
         """Delete a completed transcription (best-effort cleanup)."""
         try:
             async with session.delete(
                 f"{BASE_URL}/transcriptions/{transcription_id}",
-                headers=headers,
+                headers=self._headers,
+                timeout=self._request_timeout,
             ) as resp:
                 if resp.status != 200:
                     logger.warning(
@@ -158,7 +197,18 @@ class SonioxStreamingSTT:
         self,
         on_committed: AsyncTextCallback | None = None,
     ) -> None:
-        self._cfg = _load_config()
+        cfg = _load_config()
+        config_msg: dict[str, Any] = {
+            "api_key": cfg["api_key"],
+            "model": cfg["streaming_model"],
+            "audio_format": "s16le",
+            "sample_rate": 48000,
+            "num_channels": 1,
+        }
+        if cfg["language_hints"]:
+            config_msg["language_hints"] = cfg["language_hints"]
+        # Config must go out as a text frame; binary frames are audio
+        self._config_json = orjson.dumps(config_msg).decode()
 
         self.on_committed = on_committed
 
@@ -166,6 +216,7 @@ class SonioxStreamingSTT:
         self._receive_task: asyncio.Task[None] | None = None
         self._connected = False
         self._send_count = 0
+        self._next_send_log = 0.0
 
         self._final_parts: list[str] = []
 
@@ -174,36 +225,30 @@ class SonioxStreamingSTT:
         if self._connected:
             return
 
-        self._ws = await websockets.connect(STREAMING_URL)
+        # Raw PCM doesn't deflate; skip negotiating permessage-deflate entirely
+        self._ws = await websockets.connect(STREAMING_URL, compression=None)
 
-        config_msg: dict[str, Any] = {
-            "api_key": self._cfg["api_key"],
-            "model": self._cfg["streaming_model"],
-            "audio_format": "s16le",
-            "sample_rate": 48000,
-            "num_channels": 1,
-        }
-        if self._cfg["language_hints"]:
-            config_msg["language_hints"] = self._cfg["language_hints"]
-
-        await self._ws.send(json.dumps(config_msg))
+        await self._ws.send(self._config_json)
 
         self._connected = True
         self._final_parts.clear()
         self._send_count = 0
+        self._next_send_log = 0.0
         self._receive_task = asyncio.create_task(self._receive_loop())
         logger.debug("Soniox streaming STT connected")
 
-    async def send_audio(self, pcm_48k_mono: bytes) -> None:
+    async def send_audio(self, pcm_48k_mono: bytes | bytearray | memoryview) -> None:
         """Send a chunk of 48kHz mono PCM audio as a binary WebSocket frame."""
         if not self._ws or not self._connected:
             return
         try:
             await self._ws.send(pcm_48k_mono)
             self._send_count += 1
-            if self._send_count % 50 == 1:
+            now = time.monotonic()
+            if now >= self._next_send_log:
+                self._next_send_log = now + _SEND_LOG_INTERVAL
                 logger.info(
-                    "Soniox streaming STT: sent %d audio chunks (%d bytes each)",
+                    "Soniox streaming STT: sent %d audio chunks (last %d bytes)",
                     self._send_count, len(pcm_48k_mono),
                 )
         except websockets.ConnectionClosed as e:
@@ -231,7 +276,7 @@ class SonioxStreamingSTT:
         assert self._ws is not None
         try:
             async for raw in self._ws:
-                data = json.loads(raw)
+                data = orjson.loads(raw)
 
                 # Handle error messages
                 if "error_code" in data:
@@ -242,9 +287,11 @@ class SonioxStreamingSTT:
                     break
 
                 # Accumulate final tokens from this response
-                for token in data.get("tokens", []):
-                    if token.get("is_final"):
-                        self._final_parts.append(token.get("text", ""))
+                tokens = data.get("tokens")
+                if tokens:
+                    self._final_parts.extend(
+                        [t.get("text", "") for t in tokens if t.get("is_final")]
+                    )
 
                 # Stream finished — fire committed callback with full transcript
                 if data.get("finished"):
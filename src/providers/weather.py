@@ -1,17 +1,54 @@
 """Weather provider using Open-Meteo API."""
 
+import asyncio
+import time
+from typing import Any
+
 import aiohttp
 
 from src.config import get_config
+from src.providers.http import get_session
 
-_session: aiohttp.ClientSession | None = None
+_FORECAST_URL = "https://api.open-meteo.com/v1/forecast"
+_REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=10)
 
+# The daily forecast barely changes within minutes; reuse it across new sessions
+_CACHE_TTL = 600.0
+_cache: dict[tuple[Any, Any, str], tuple[float, dict[str, str]]] = {}
+# Requests in flight, so concurrent cache misses share one fetch
+_inflight: dict[tuple[Any, Any, str], asyncio.Task[dict[str, str]]] = {}
 
-async def _get_session() -> aiohttp.ClientSession:
-    global _session
-    if _session is None or _session.closed:
-        _session = aiohttp.ClientSession()
-    return _session
+# WMO weather interpretation codes
+_WEATHER_CODES: dict[str, str] = {
+    "0": "晴",
+    "1": "大部晴朗",
+    "2": "多云",
+    "3": "阴",
+    "45": "雾",
+    "48": "雾凇",
+    "51": "小毛毛雨",
+    "53": "中毛毛雨",
+    "55": "大毛毛雨",
+    "56": "冻毛毛雨",
+    "57": "强冻毛毛雨",
+    "61": "小雨",
+    "63": "中雨",
+    "65": "大雨",
+    "66": "小冻雨",
+    "67": "大冻雨",
+    "71": "小雪",
+    "73": "中雪",
+    "75": "大雪",
+    "77": "霰",
+    "80": "小阵雨",
+    "81": "中阵雨",
+    "82": "大阵雨",
+    "85": "小阵雪",
+    "86": "大阵雪",
+    "95": "雷暴",
+    "96": "雷暴伴小冰雹",
+    "99": "雷暴伴大冰雹",
+}
 
 
 async def get_weather() -> dict[str, str]:
@@ -27,54 +64,45 @@ async def get_weather() -> dict[str, str]:
     longitude = weather_config["longitude"]
     timezone = weather_config["timezone"]
 
-    url = (
-        f"https://api.open-meteo.com/v1/forecast?"
-        f"latitude={latitude}&longitude={longitude}"
-        f"&daily=weather_code,temperature_2m_max,temperature_2m_min"
-        f"&timezone={timezone}&forecast_days=1"
-    )
+    key = (latitude, longitude, timezone)
+    cached = _cache.get(key)
+    if cached is not None and time.monotonic() - cached[0] < _CACHE_TTL:
+        return dict(cached[1])
+
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.create_task(_fetch_weather(key))
+        _inflight[key] = task
+        task.add_done_callback(lambda _: _inflight.pop(key, None))
+    # Shield so one caller being cancelled does not abort the others' fetch
+    return dict(await asyncio.shield(task))
+
 
-    session = await _get_session()
-    async with session.get(url) as response:
+async def _fetch_weather(key: tuple[Any, Any, str]) -> dict[str, str]:
+    """Request the forecast for *key* and cache it on success."""
+    latitude, longitude, timezone = key
+    params = {
+        "latitude": latitude,
+        "longitude": longitude,
+        "daily": "weather_code,temperature_2m_max,temperature_2m_min",
+        "timezone": timezone,
+        "forecast_days": 1,
+    }
+
+    session = await get_session()
+    async with session.get(_FORECAST_URL, params=params, timeout=_REQUEST_TIMEOUT) as response:
         data = await response.json()
         daily = data.get("daily", {})
-        return {
+        result = {
             "weather_code": str(daily.get("weather_code", [""])[0]),
             "temp_max": str(daily.get("temperature_2m_max", [""])[0]),
             "temp_min": str(daily.get("temperature_2m_min", [""])[0]),
         }
+    if daily:
+        _cache[key] = (time.monotonic(), result)
+    return result
 
 
 def weather_code_to_description(code: str) -> str:
     """Convert WMO weather code to human-readable description."""
-    codes = {
-        "0": "晴",
-        "1": "大部晴朗",
-        "2": "多云",
-        "3": "阴",
-        "45": "雾",
-        "48": "雾凇",
-        "51": "小毛毛雨",
-        "53": "中毛毛雨",
-        "55": "大毛毛雨",
-        "56": "冻毛毛雨",
-        "57": "强冻毛毛雨",
-        "61": "小雨",
-        "63": "中雨",
-        "65": "大雨",
-        "66": "小冻雨",
-        "67": "大冻雨",
-        "71": "小雪",
-        "73": "中雪",
-        "75": "大雪",
-        "77": "霰",
-        "80": "小阵雨",
-        "81": "中阵雨",
-        "82": "大阵雨",
-        "85": "小阵雪",
-        "86": "大阵雪",
-        "95": "雷暴",
-        "96": "雷暴伴小冰雹",
-        "99": "雷暴伴大冰雹",
-    }
-    return codes.get(code, "未知")
+    return _WEATHER_CODES.get(code, "未知")
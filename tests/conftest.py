@@ -7,7 +7,7 @@ from unittest.mock import patch
 import pytest
 import yaml
 
-from src.config import Config, DEFAULTS
+from src.config import Config, DEFAULTS, YamlDumper
 
 
 @pytest.fixture(autouse=True)
@@ -59,10 +59,10 @@ def config_file(tmp_path):
         },
     }
     path = tmp_path / "config.yaml"
-    path.write_text(yaml.dump(cfg), encoding="utf-8")
+    path.write_text(yaml.dump(cfg, Dumper=YamlDumper), encoding="utf-8")
 
     config = Config()
-    config.load(path)
+    config.load_from_mapping(cfg, path)
 
     # Ensure data subdirs exist
     data_dir = config.data_dir
@@ -5,7 +5,13 @@ import wave
 import io
 from array import array
 
-from src.media.audio import AudioResampler, PCMStreamSource
+from src.media.audio import (
+    AudioResampler,
+    PCMStreamSource,
+    StereoDownmixer,
+    StreamingResampler,
+    is_silent,
+)
 
 
 class TestAudioResamplerDiscordToStt:
@@ -29,6 +35,17 @@ class TestAudioResamplerDiscordToStt:
         assert len(mono) == 1920
 
 
+class TestStereoDownmixer:
+    def test_matches_discord_to_stt(self):
+        downmixer = StereoDownmixer()
+        out = bytearray()
+        for values in ([100, 200, -300, -101], [32767, 32767, -32768, -32768, 1, 2]):
+            stereo = array("h", values).tobytes()
+            out.clear()
+            downmixer.downmix_into(stereo, out)
+            assert bytes(out) == AudioResampler.discord_to_stt(stereo)
+
+
 class TestAudioResamplerTtsToDiscord:
     def test_mono_to_stereo_doubles_size(self):
         mono = array("h", [100, 200, 300])
@@ -51,6 +68,27 @@ class TestAudioResamplerTtsToDiscord:
         assert list(result) == list(original)
 
 
+class TestStreamingResampler:
+    def test_chunked_output_matches_single_pass(self):
+        pcm = array("h", [(i * 37) % 2000 - 1000 for i in range(4410)]).tobytes()
+        whole = StreamingResampler(44100, 48000)
+        expected = whole.process(pcm) + whole.flush()
+
+        chunked = StreamingResampler(44100, 48000)
+        out = b""
+        for start in range(0, len(pcm), 882):
+            out += chunked.process(pcm[start:start + 882])
+        out += chunked.flush()
+        assert out == expected
+        assert len(out) == 4800 * 2
+
+    def test_upsample_interpolates_linearly(self):
+        resampler = StreamingResampler(1, 2)
+        pcm = array("h", [0, 100, 200, 300]).tobytes()
+        out = array("h", resampler.process(pcm) + resampler.flush())
+        assert list(out) == [0, 50, 100, 150, 200, 250, 300, 300]
+
+
 class TestPcmToWav:
     def test_valid_wav_header(self):
         pcm = b"\x00\x01" * 480  # 480 samples of silence-ish
@@ -71,6 +109,19 @@ class TestPcmToWav:
             assert wf.getnchannels() == 2
 
 
+class TestIsSilent:
+    def test_all_zero_frame(self):
+        assert is_silent(b"\x00" * 3840)
+
+    def test_single_nonzero_sample(self):
+        frame = bytearray(3840)
+        frame[-1] = 1
+        assert not is_silent(bytes(frame))
+
+    def test_empty_buffer(self):
+        assert is_silent(b"")
+
+
 class TestPCMStreamSource:
     def test_read_returns_silence_on_empty_buffer(self):
         source = PCMStreamSource()
@@ -94,6 +145,12 @@ class TestPCMStreamSource:
         frame2 = source.read()
         assert len(frame2) == PCMStreamSource.FRAME_SIZE
 
+    def test_feed_mono_upmixes_to_stereo(self):
+        source = PCMStreamSource()
+        mono = array("h", [7, -7] * (PCMStreamSource.FRAME_SIZE // 8)).tobytes()
+        source.feed_mono(mono)
+        assert source.read() == AudioResampler.tts_to_discord(mono)
+
     def test_finish_drains_remaining_with_padding(self):
         source = PCMStreamSource()
         # Use 2000 bytes so the unfaded portion is large enough to verify
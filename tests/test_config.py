@@ -28,6 +28,18 @@ class TestConfigLoad:
         assert config.llm["model"] == "testprov/test-model"
         assert config.llm["timeout"] == 30
 
+    def test_load_reads_yaml_file(self, config_file):
+        config = Config()
+        config.load_from_mapping({})
+        config.load(config_file)
+        assert config.get("default_persona") == "test-persona"
+
+    def test_load_from_mapping_without_path(self):
+        config = Config()
+        config.load_from_mapping({"default_persona": "mapped"})
+        assert config.get("default_persona") == "mapped"
+        assert config.reload_if_changed() is False
+
     def test_reload_if_changed_returns_false_when_unchanged(self, config_file):
         config = Config()
         assert config.reload_if_changed() is False
@@ -42,6 +54,13 @@ class TestConfigLoad:
         assert config.reload_if_changed() is True
         assert config.get("default_persona") == "updated"
 
+    def test_generation_changes_on_each_load(self, config_file):
+        config = Config()
+        first = config.generation
+        config.load(config_file)
+        assert config.generation != first
+        assert config.generation != 0
+
     def test_reload_if_changed_no_path(self):
         config = Config()
         # Never loaded — _config_path is None
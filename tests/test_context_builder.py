@@ -1,10 +1,13 @@
 """Tests for ContextBuilder persona loading, turn saving, and cache file saving."""
 
+import os
+from pathlib import Path
 from typing import Any, cast
 
 import pytest
 import yaml
 
+from src.config import YamlDumper
 from src.core.context_builder import ContextBuilder
 
 
@@ -16,7 +19,7 @@ class TestLoadPersona:
 
         (persona_dir / "soul.md").write_text("You are a cat.", encoding="utf-8")
         (persona_dir / "persona.yaml").write_text(
-            yaml.dump({"nickname": "Kitty", "voice_id": "voice123"}),
+            yaml.dump({"nickname": "Kitty", "voice_id": "voice123"}, Dumper=YamlDumper),
             encoding="utf-8",
         )
 
@@ -43,6 +46,22 @@ class TestLoadPersona:
         assert persona["nickname"] == "simple"  # Falls back to persona_id
         assert persona["voice_id"] is None
 
+    def test_load_persona_cached_until_file_changes(self, config_file):
+        cb = ContextBuilder()
+        persona_dir = cb.data_dir / cb.config.paths["personas_dir"] / "cached"
+        persona_dir.mkdir(parents=True, exist_ok=True)
+        soul_path = persona_dir / "soul.md"
+        soul_path.write_text("v1", encoding="utf-8")
+        assert cb.load_persona("cached")["prompt"] == "v1"
+
+        cb.load_persona("cached")["prompt"] = "mutated"
+        assert cb.load_persona("cached")["prompt"] == "v1"
+
+        soul_path.write_text("v2", encoding="utf-8")
+        stat = soul_path.stat()
+        os.utime(soul_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert cb.load_persona("cached")["prompt"] == "v2"
+
 
 class TestSaveTurn:
     def test_save_turn_creates_user_and_assistant_events(self, config_file):
@@ -103,6 +122,13 @@ class TestSaveCacheFile:
         path2 = cb.save_cache_file("p", 1, "a.png", b"2")
         assert path1 != path2
 
+    def test_identical_data_is_deduplicated(self, config_file):
+        cb = ContextBuilder()
+        path1 = cb.save_cache_file("p", 1, "a.png", b"same")
+        path2 = cb.save_cache_file("p", 1, "b.png", b"same")
+        assert path1 == path2
+        assert [p.name for p in (cb.data_dir / path1).parent.iterdir()] == [Path(path1).name]
+
 
 class TestSharedPrompts:
     def test_loads_shared_prompts(self, config_file):
@@ -116,6 +142,22 @@ class TestSharedPrompts:
         prompts = cb._load_shared_prompts()
         assert prompts == ["Be nice."]
 
+    def test_shared_prompt_reread_after_change(self, config_file):
+        cb = ContextBuilder()
+        cb.config._data["prompts"] = ["rules.md"]
+        path = cb.data_dir / "prompts" / "rules.md"
+        path.parent.mkdir(exist_ok=True)
+        path.write_text("v1", encoding="utf-8")
+        assert cb._load_shared_prompts() == ["v1"]
+
+        cb._load_shared_prompts().append("extra")
+        assert cb._load_shared_prompts() == ["v1"]
+
+        path.write_text("v2", encoding="utf-8")
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert cb._load_shared_prompts() == ["v2"]
+
     def test_missing_prompt_file_skipped(self, config_file):
         cb = ContextBuilder()
         cb.config._data["prompts"] = ["nonexistent.md"]
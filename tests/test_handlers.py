@@ -1,8 +1,18 @@
 """Tests for MessageHandler segment parsing and format_user_message."""
 
+import asyncio
+import gc
+import logging
+from collections import defaultdict
+from types import SimpleNamespace
+
 import pytest
 
-from src.discord.handlers import MessageHandler, format_user_message
+from src.discord.handlers import (
+    _MAX_PENDING_PER_SCOPE,
+    MessageHandler,
+    format_user_message,
+)
 
 
 class _FakeTTS:
@@ -135,3 +145,104 @@ class TestBuildSegments:
         assert segments[0] == {"type": "text", "content": "before"}
         assert segments[1]["type"] == "tts"
         assert segments[2] == {"type": "text", "content": "after"}
+
+
+class _FakeUserState:
+    def get_persona_id(self, user_id: int) -> str:
+        return "meowko"
+
+
+class TestPendingLimit:
+    @pytest.mark.asyncio
+    async def test_drops_message_when_scope_queue_full(self):
+        handler = MessageHandler.__new__(MessageHandler)
+        handler.user_state = _FakeUserState()
+        handler._pending = defaultdict(list)
+        handler._pending["meowko-1"] = [{}] * _MAX_PENDING_PER_SCOPE
+
+        async def fail(*args):
+            raise AssertionError("media should not be processed")
+
+        handler._extract_images = fail
+        handler._transcribe_audio = fail
+
+        message = SimpleNamespace(
+            author=SimpleNamespace(id=1, display_name="Alice"),
+            content="spam",
+            attachments=[],
+        )
+        assert await handler.handle_message(message) is None
+        assert len(handler._pending["meowko-1"]) == _MAX_PENDING_PER_SCOPE
+
+    @pytest.mark.asyncio
+    async def test_cap_rechecked_after_media_extraction(self):
+        handler = MessageHandler.__new__(MessageHandler)
+        handler.user_state = _FakeUserState()
+        handler._pending = defaultdict(list)
+
+        async def fill_queue(attachments):
+            # Other messages for the scope were queued while this one awaited
+            handler._pending["meowko-1"] = [{}] * _MAX_PENDING_PER_SCOPE
+            return []
+
+        async def no_audio(attachments):
+            return []
+
+        handler._extract_images = fill_queue
+        handler._transcribe_audio = no_audio
+
+        message = SimpleNamespace(
+            author=SimpleNamespace(id=1, display_name="Alice"),
+            content="spam",
+            attachments=[],
+        )
+        assert await handler.handle_message(message) is None
+        assert len(handler._pending["meowko-1"]) == _MAX_PENDING_PER_SCOPE
+
+    def test_cap_check_does_not_create_scope_entry(self):
+        handler = MessageHandler.__new__(MessageHandler)
+        handler._pending = defaultdict(list)
+        assert handler._queue_full("meowko-2", "Bob") is False
+        assert "meowko-2" not in handler._pending
+
+
+class TestBatchFailure:
+    @pytest.mark.asyncio
+    async def test_failure_is_set_on_every_batched_future(self, caplog):
+        handler = MessageHandler.__new__(MessageHandler)
+        handler.user_state = _FakeUserState()
+        handler._pending = defaultdict(list)
+        handler._scope_locks = defaultdict(asyncio.Lock)
+
+        async def no_media(attachments):
+            return []
+
+        async def fail(batch, user_id, persona_id):
+            raise RuntimeError("LLM down")
+
+        handler._extract_images = no_media
+        handler._transcribe_audio = no_media
+        handler._process_batch = fail
+
+        other = asyncio.get_running_loop().create_future()
+        handler._pending["meowko-1"].append({"future": other})
+
+        message = SimpleNamespace(
+            author=SimpleNamespace(id=1, display_name="Alice"),
+            content="hi",
+            attachments=[],
+        )
+        with caplog.at_level(logging.ERROR, logger="asyncio"):
+            # Not pytest.raises: its traceback would keep the batch alive past gc
+            try:
+                await handler.handle_message(message)
+            except RuntimeError:
+                pass
+            else:
+                pytest.fail("handle_message should re-raise the batch failure")
+            assert isinstance(other.exception(), RuntimeError)
+            assert "meowko-1" not in handler._pending
+            # The shared exception's traceback pins the batch; release it
+            del other
+            gc.collect()
+        assert "exception was never retrieved" not in caplog.text
@@ -29,6 +29,32 @@ class TestAppendAndRead:
         assert len(events) == 3
         assert events[2]["content"] == "bye"
 
+    def test_tail_returns_last_events(self, config_file):
+        store = JSONLStore()
+        for i in range(5):
+            store.append("p", 1, {"role": "user", "content": str(i)})
+
+        assert [e["content"] for e in store.tail("p", 1, 2)] == ["3", "4"]
+        assert store.tail("p", 2, 2) == []
+
+    def test_tail_spans_read_chunks(self, config_file):
+        store = JSONLStore()
+        for ch in "abc":
+            store.append("p", 1, {"role": "user", "content": ch * 10000})
+
+        assert [e["content"][0] for e in store.tail("p", 1, 2)] == ["b", "c"]
+
+    def test_append_many_writes_in_order(self, config_file):
+        store = JSONLStore()
+        store.append("p", 1, {"role": "system", "content": "ctx"})
+        path = store.append_many("p", 1, [
+            {"role": "user", "content": "hi"},
+            {"role": "assistant", "content": "hello"},
+        ])
+
+        assert [e["content"] for e in store.read_all("p", 1)] == ["ctx", "hi", "hello"]
+        assert path.read_text(encoding="utf-8").count("\n") == 3
+
     def test_read_all_returns_empty_for_nonexistent(self, config_file):
         store = JSONLStore()
         assert store.read_all("nope", 999) == []
@@ -80,6 +106,18 @@ class TestRewind:
         assert len(events) == 2
         assert events[-1]["content"] == "reply1"
 
+    def test_rewind_spans_read_chunks(self, config_file):
+        store = JSONLStore()
+        store.append("p", 1, {"role": "user", "content": "a" * 10000})
+        store.append("p", 1, {"role": "assistant", "content": "b" * 10000})
+        store.append("p", 1, {"role": "user", "content": "c" * 10000})
+        for _ in range(3):
+            store.append("p", 1, {"role": "assistant", "content": "d" * 5000})
+
+        assert store.rewind("p", 1) == 4
+        events = store.read_all("p", 1)
+        assert [e["content"][0] for e in events] == ["a", "b"]
+
     def test_rewind_single_user_message_deletes_file(self, config_file):
         store = JSONLStore()
         path = store.append("p", 1, {"role": "user", "content": "only"})
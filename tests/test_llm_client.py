@@ -1,6 +1,17 @@
-"""Tests for LLMResponse."""
+"""Tests for LLMResponse and the shared client factory."""
 
-from src.providers.llm_client import LLMResponse
+from types import SimpleNamespace
+
+import pytest
+
+from src.config import get_config
+from src.providers.llm_client import (
+    LLMClient,
+    LLMResponse,
+    LLMStream,
+    _scrub_images,
+    get_llm_client,
+)
 
 
 class TestLLMResponse:
@@ -27,3 +38,111 @@ class TestLLMResponse:
         assert r.total_tokens == 150
         assert r.cached_tokens == 20
         assert r.cost == 0.003
+
+
+class TestGetLLMClient:
+    def test_reused_until_config_reload(self, config_file):
+        client = get_llm_client()
+        assert get_llm_client() is client
+        get_config().load(config_file)
+        assert get_llm_client() is not client
+
+
+class TestSaveRequest:
+    def test_keeps_most_recent_files(self, config_file):
+        request_dir = LLMClient()._request_dir
+        request_dir.mkdir(parents=True)
+        for i in range(3):
+            (request_dir / f"20000101-00000{i}-000000.json").write_text("{}")
+
+        client = LLMClient()
+        for i in range(5):
+            client._save_request([{"role": "user", "content": str(i)}], 0.7)
+
+        files = sorted(request_dir.glob("*.json"))
+        assert len(files) == LLMClient._MAX_SAVED_REQUESTS
+        assert not any(f.name.startswith("2000") for f in files)
+
+
+class TestComputeUsageAndCost:
+    def test_prices_cached_and_uncached_tokens(self, config_file):
+        usage = SimpleNamespace(
+            prompt_tokens=1_000_000,
+            completion_tokens=500_000,
+            total_tokens=1_500_000,
+            prompt_tokens_details=SimpleNamespace(cached_tokens=200_000),
+        )
+        pt, ct, tt, cached, cost = LLMClient()._compute_usage_and_cost(usage)
+        assert (pt, ct, tt, cached) == (1_000_000, 500_000, 1_500_000, 200_000)
+        # 0.8M input @1.0 + 0.2M cached @0.5 + 0.5M output @2.0
+        assert cost == pytest.approx(0.8 + 0.1 + 1.0)
+
+    def test_missing_usage_details(self, config_file):
+        client = LLMClient()
+        assert client._compute_usage_and_cost(None) == (0, 0, 0, 0, 0.0)
+        usage = SimpleNamespace(
+            prompt_tokens=10, completion_tokens=5, total_tokens=15, prompt_tokens_details=None,
+        )
+        assert client._compute_usage_and_cost(usage)[3] == 0
+
+
+class TestScrubImages:
+    def test_replaces_inline_image_data(self):
+        data_url = "data:image/png;base64," + "A" * 1000
+        messages = [
+            {"role": "system", "content": "persona"},
+            {"role": "user", "content": [
+                {"type": "text", "text": "look"},
+                {"type": "image_url", "image_url": {"url": data_url}},
+                {"type": "image_url", "image_url": {"url": "https://example.com/a.png"}},
+            ]},
+        ]
+        scrubbed = _scrub_images(messages)
+
+        assert scrubbed[0] is messages[0]
+        blocks = scrubbed[1]["content"]
+        assert blocks[0] == {"type": "text", "text": "look"}
+        url = blocks[1]["image_url"]["url"]
+        assert url.startswith("data:image/png;base64,<1000 chars, sha256=")
+        assert blocks[2]["image_url"]["url"] == "https://example.com/a.png"
+        # The caller's messages are left untouched
+        assert messages[1]["content"][1]["image_url"]["url"] == data_url
+
+
+def _chunk(content=None, usage=None):
+    choices = [SimpleNamespace(delta=SimpleNamespace(content=content))] if content else []
+    return SimpleNamespace(choices=choices, usage=usage)
+
+
+class TestLLMStream:
+    @pytest.mark.asyncio
+    async def test_yields_tokens_and_reads_final_usage(self, config_file):
+        usage = SimpleNamespace(
+            prompt_tokens=10, completion_tokens=2, total_tokens=12, prompt_tokens_details=None,
+        )
+
+        async def chunks():
+            yield _chunk("he")
+            yield _chunk("llo")
+            yield _chunk(usage=usage)
+
+        stream = LLMStream(chunks(), LLMClient())
+        assert [token async for token in stream] == ["he", "llo"]
+        assert stream.response is not None
+        assert stream.response.content == "hello"
+        assert stream.response.total_tokens == 12
+
+    @pytest.mark.asyncio
+    async def test_keeps_usage_sent_before_last_chunk(self, config_file):
+        usage = SimpleNamespace(
+            prompt_tokens=10, completion_tokens=2, total_tokens=12, prompt_tokens_details=None,
+        )
+
+        async def chunks():
+            yield _chunk("hi", usage=usage)
+            yield _chunk()
+
+        stream = LLMStream(chunks(), LLMClient())
+        assert [token async for token in stream] == ["hi"]
+        assert stream.response is not None
+        assert stream.response.total_tokens == 12
@@ -2,6 +2,8 @@
 
 import asyncio
 import logging
+import logging.handlers
+import time
 
 import pytest
 
@@ -38,3 +40,73 @@ class TestConfigWatcher:
 
         assert fake.reload_calls == 1
         assert "Config reload failed" in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_config_watcher_backs_off_until_change(self, monkeypatch):
+        results = iter([False, False, False, True, False])
+        delays: list[float] = []
+
+        class _Config:
+            def reload_if_changed(self) -> bool:
+                return next(results)
+
+        async def _fake_sleep(delay: float) -> None:
+            if len(delays) == 5:
+                raise asyncio.CancelledError
+            delays.append(delay)
+
+        monkeypatch.setattr(main, "get_config", lambda: _Config())
+        monkeypatch.setattr(asyncio, "sleep", _fake_sleep)
+
+        with pytest.raises(asyncio.CancelledError):
+            await main.config_watcher(interval=5, max_interval=30)
+
+        assert delays == [5, 10, 20, 30, 5]
+
+
+class TestSetupLogging:
+    def test_records_reach_file_through_queue(self, tmp_path, monkeypatch):
+        root = logging.getLogger()
+        monkeypatch.setattr(root, "handlers", [])
+        monkeypatch.setattr(root, "level", root.level)
+        log_file = tmp_path / "logs" / "meowko.log"
+
+        main.setup_logging(log_file=log_file)
+        try:
+            assert isinstance(root.handlers[0], logging.handlers.QueueHandler)
+            logging.getLogger("meowko.test").info("first line\nsecond line")
+        finally:
+            main.stop_logging()
+
+        assert "first line | second line" in log_file.read_text(encoding="utf-8")
+
+    def test_keeps_only_newest_backups(self, tmp_path, monkeypatch):
+        root = logging.getLogger()
+        monkeypatch.setattr(root, "handlers", [])
+        monkeypatch.setattr(root, "level", root.level)
+        for day in range(1, 8):
+            (tmp_path / f"meowko_2026010{day}_000000.log").write_text("old")
+        (tmp_path / "other.log").write_text("keep")
+
+        main.setup_logging(log_file=tmp_path / "meowko.log")
+        main.stop_logging()
+
+        backups = sorted(p.name for p in tmp_path.glob("meowko_*.log"))
+        assert backups == [f"meowko_2026010{day}_000000.log" for day in range(4, 8)]
+        assert (tmp_path / "other.log").exists()
+
+
+class TestBatchedFileHandler:
+    def test_quiet_records_flush_after_interval(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(main._BatchedFileHandler, "FLUSH_INTERVAL", 0.05)
+        log_file = tmp_path / "batched.log"
+        handler = main._BatchedFileHandler(log_file, encoding="utf-8")
+        try:
+            handler.handle(logging.makeLogRecord({"msg": "quiet", "levelno": logging.INFO}))
+            assert log_file.read_text(encoding="utf-8") == ""
+            deadline = time.monotonic() + 2
+            while "quiet" not in log_file.read_text(encoding="utf-8"):
+                assert time.monotonic() < deadline
+                time.sleep(0.01)
+        finally:
+            handler.close()
@@ -43,3 +43,27 @@ class TestUserState:
         state = UserState()
         state._write(8, {"persona_id": ["bad"]})
         assert state.get_persona_id(8) == "test-persona"
+
+    def test_sees_writes_from_other_instance(self, config_file):
+        reader = UserState()
+        writer = UserState()
+        assert reader.get_persona_id(5) == "test-persona"
+        writer.set_persona_id(5, "first")
+        assert reader.get_persona_id(5) == "first"
+        writer.set_persona_id(5, "second-choice")
+        assert reader.get_persona_id(5) == "second-choice"
+
+    def test_sees_same_size_writes_from_other_instance(self, config_file):
+        reader = UserState()
+        writer = UserState()
+        for persona_id in ("alpha", "bravo", "alpha", "bravo"):
+            writer.set_persona_id(5, persona_id)
+            assert reader.get_persona_id(5) == persona_id
+
+    def test_unchanged_selection_skips_write(self, config_file):
+        state = UserState()
+        state.set_persona_id(6, "same")
+        writes = []
+        state._write = lambda user_id, data: writes.append(user_id)
+        state.set_persona_id(6, "same")
+        assert writes == []
@@ -0,0 +1,93 @@
+"""Tests for voice-channel text helpers."""
+
+import asyncio
+from array import array
+from types import SimpleNamespace
+
+import pytest
+
+from src.discord import voice
+from src.discord.voice import UserAudioStream, VoiceSession, _TagStripper
+
+
+def _strip_stream(tokens: list[str]) -> str:
+    stripper = _TagStripper()
+    out = "".join(stripper.feed(t) for t in tokens)
+    return out + stripper.flush()
+
+
+class TestStripTags:
+    def test_plain_text_unchanged(self):
+        assert VoiceSession._strip_tags("  hello there ") == "hello there"
+
+    def test_removes_tti_block_and_tts_tags(self):
+        text = "Hi [tts]meow[/tts] [tti]a cat\non a mat[/tti] bye"
+        assert VoiceSession._strip_tags(text) == "Hi meow  bye"
+
+    def test_unclosed_tti_kept(self):
+        assert VoiceSession._strip_tags("a [tti]b") == "a [tti]b"
+
+    def test_orphan_close_kept_and_tts_after_unclosed_stripped(self):
+        text = "x [/tti] [tti]y [tts]z[/tts]"
+        assert VoiceSession._strip_tags(text) == "x [/tti] [tti]y z"
+
+
+class TestTagStripper:
+    def test_passes_plain_tokens(self):
+        assert _strip_stream(["hel", "lo"]) == "hello"
+
+    def test_strips_tags_split_across_tokens(self):
+        tokens = ["Hi [t", "ts]me", "ow[/", "tts] ok"]
+        assert _strip_stream(tokens) == "Hi meow ok"
+
+    def test_suppresses_tti_block_split_across_tokens(self):
+        tokens = ["a [tt", "i]draw", " cat[/t", "ti]b"]
+        assert _strip_stream(tokens) == "a b"
+
+    def test_unclosed_tti_dropped(self):
+        assert _strip_stream(["a [tti]never closed"]) == "a "
+
+    def test_non_tag_bracket_emitted(self):
+        assert _strip_stream(["x [note] y"]) == "x [note] y"
+
+    def test_partial_tag_flushed_at_end(self):
+        assert _strip_stream(["tail [tt"]) == "tail [tt"
+
+
+class _SlowSTT:
+    def __init__(self, on_committed=None):
+        self.release = asyncio.Event()
+        self._connected = False
+
+    async def connect(self):
+        await self.release.wait()
+        self._connected = True
+
+    async def close(self):
+        self._connected = False
+
+    async def send_audio(self, data):
+        pass
+
+
+class TestUserAudioStreamReconnect:
+    @pytest.mark.asyncio
+    async def test_dropped_stream_reconnects_without_blocking_feed(self, monkeypatch):
+        monkeypatch.setattr(voice, "SonioxStreamingSTT", _SlowSTT)
+        session = SimpleNamespace(
+            is_playing=lambda: False, endpointing_secs=10.0,
+            stt_send_bytes=1 << 20, stt_send_max_delay=10.0,
+        )
+        stream = UserAudioStream(SimpleNamespace(display_name="Alice"), session)
+        stream._stt = _SlowSTT()  # connected once, now dropped
+        stream._connected_event.set()
+        stream._send_buffer.extend(b"\x01\x00")
+
+        frame = array("h", [100] * 1920).tobytes()
+        await asyncio.wait_for(stream.feed_audio(frame), timeout=1)
+        await asyncio.wait_for(stream.feed_audio(frame), timeout=1)
+
+        assert not stream._connected_event.is_set()
+        assert stream._audio_buffer[:2] == b"\x01\x00"
+        assert len(stream._audio_buffer) == 2 + 2 * 1920
+        await stream.close()
@@ -1,6 +1,56 @@
 """Tests for weather utility functions."""
 
-from src.providers.weather import weather_code_to_description
+import asyncio
+
+import pytest
+
+from src.providers import weather
+from src.providers.weather import get_weather, weather_code_to_description
+
+
+class _FakeResponse:
+    def __init__(self, data):
+        self._data = data
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def json(self):
+        return self._data
+
+
+class _FakeSession:
+    def __init__(self, data):
+        self.data = data
+        self.urls: list = []
+        self.params: list = []
+
+    def get(self, url, params=None, **kwargs):
+        self.urls.append(url)
+        self.params.append(params)
+        return _FakeResponse(self.data)
+
+
+@pytest.fixture()
+def fake_session(monkeypatch, config_file):
+    session = _FakeSession({
+        "daily": {
+            "weather_code": [3],
+            "temperature_2m_max": [20.5],
+            "temperature_2m_min": [11.0],
+        },
+    })
+
+    async def get_session():
+        return session
+
+    monkeypatch.setattr(weather, "get_session", get_session)
+    monkeypatch.setattr(weather, "_cache", {})
+    monkeypatch.setattr(weather, "_inflight", {})
+    return session
 
 
 class TestWeatherCodeToDescription:
@@ -26,3 +76,37 @@ class TestWeatherCodeToDescription:
 
     def test_fog(self):
         assert weather_code_to_description("45") == "雾"
+
+
+class TestGetWeather:
+    @pytest.mark.asyncio
+    async def test_parses_daily_forecast(self, fake_session):
+        assert await get_weather() == {"weather_code": "3", "temp_max": "20.5", "temp_min": "11.0"}
+        query = fake_session.params[0]
+        assert query["daily"] == "weather_code,temperature_2m_max,temperature_2m_min"
+        assert query["forecast_days"] == 1
+
+    @pytest.mark.asyncio
+    async def test_cached_within_ttl(self, fake_session, monkeypatch):
+        first = await get_weather()
+        first["temp_max"] = "mutated"
+        assert (await get_weather())["temp_max"] == "20.5"
+        assert len(fake_session.urls) == 1
+
+        monkeypatch.setattr(weather, "_CACHE_TTL", 0.0)
+        await get_weather()
+        assert len(fake_session.urls) == 2
+
+    @pytest.mark.asyncio
+    async def test_error_response_not_cached(self, fake_session):
+        fake_session.data = {"error": True}
+        await get_weather()
+        await get_weather()
+        assert len(fake_session.urls) == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_request(self, fake_session):
+        results = await asyncio.gather(get_weather(), get_weather(), get_weather())
+        assert all(r["weather_code"] == "3" for r in results)
+        assert len(fake_session.urls) == 1
+        assert not weather._inflight